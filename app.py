@@ -4,35 +4,19 @@ Main application entry point
 """
 
 import os
-import gradio as gr
-from dotenv import load_dotenv
 import logging
 
-# Import UI components
-from src.ragspace.ui.components import (
-    create_knowledge_management_tab,
-    create_chat_interface_tab,
-    create_mcp_tools_tab
-)
-
-# Import MCP tools
-from src.ragspace.mcp.tools import expose_mcp_tools
-
-# Import storage management
-from src.ragspace.storage import use_supabase
-
-# Load environment variables
-load_dotenv()
+# Load environment variables (skippable for tests/CLI tooling)
+if not os.getenv("RAGSPACE_SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_gradio_interface():
-    """Create the main Gradio interface with modern layout"""
-    
-    # Custom CSS for better styling
-    custom_css = """
+# Custom CSS for better styling (built once, shared across interface rebuilds)
+_CUSTOM_CSS = """
     .sidebar {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         padding: 20px;
@@ -110,11 +94,35 @@ def create_gradio_interface():
         background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%);
     }
     """
-    
+
+# Static header/footer Markdown, built once at import time
+_HEADER_TITLE_MD = "# 🤖 RAGSpace - AI Knowledge Hub"
+_HEADER_SUBTITLE_MD = "Build and query your personal knowledge base with AI assistance."
+_FOOTER_MD = """
+    ### 🚀 Current Features
+    - **Knowledge Management**: Create and manage document collections
+    - **File Upload**: Upload documents to your knowledge base
+    - **URL Integration**: Add websites and GitHub repositories
+    - **AI Chat**: Query your knowledge base with natural language
+    - **MCP Integration**: Model Context Protocol support for external tools
+    """
+
+def create_gradio_interface():
+    """Create the main Gradio interface with modern layout"""
+    # Heavy imports are deferred so that importing app.py stays cheap
+    # (gradio alone takes seconds to import on cold start)
+    import gradio as gr
+    from src.ragspace.ui.components import (
+        create_knowledge_management_tab,
+        create_chat_interface_tab,
+        create_mcp_tools_tab
+    )
+    from src.ragspace.mcp.tools import expose_mcp_tools
+
     # Create the interface
-    with gr.Blocks(title="RAGSpace - AI Knowledge Hub", theme=gr.themes.Glass(), css=custom_css) as demo:
-        gr.Markdown("# 🤖 RAGSpace - AI Knowledge Hub")
-        gr.Markdown("Build and query your personal knowledge base with AI assistance.")
+    with gr.Blocks(title="RAGSpace - AI Knowledge Hub", theme=gr.themes.Glass(), css=_CUSTOM_CSS) as demo:
+        gr.Markdown(_HEADER_TITLE_MD)
+        gr.Markdown(_HEADER_SUBTITLE_MD)
         
         with gr.Tabs() as tabs:
             # Create UI components
@@ -127,14 +135,7 @@ def create_gradio_interface():
         
         # Footer
         gr.Markdown("---")
-        gr.Markdown("""
-        ### 🚀 Current Features
-        - **Knowledge Management**: Create and manage document collections
-        - **File Upload**: Upload documents to your knowledge base
-        - **URL Integration**: Add websites and GitHub repositories
-        - **AI Chat**: Query your knowledge base with natural language
-        - **MCP Integration**: Model Context Protocol support for external tools
-        """)
+        gr.Markdown(_FOOTER_MD)
 
         # MCP Tools - Define functions with api_name to control exposure
         expose_mcp_tools()
@@ -145,6 +146,7 @@ def main():
     """Main application entry point"""
     try:
         # Switch to Supabase storage for production
+        from src.ragspace.storage import use_supabase
         use_supabase()
         
         # Check if we're in development mode
@@ -167,8 +169,8 @@ def main():
             server_port=int(os.getenv("PORT", 8000)),
             mcp_server=True,  # Enable MCP server
             share=False,  # Disable public sharing for production
-            debug=is_dev,  # Enable debug mode for development
-            show_error=True  # Show detailed error messages
+            show_error=is_dev,  # Detailed error rendering only in dev
+            quiet=not is_dev  # Skip per-request log writes in production
         )
         
     except Exception as e:
@@ -6,16 +6,24 @@ Simple development server with file watching
 import os
 import sys
 import time
+import threading
 import subprocess
-import signal
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+# Directories whose writes should never trigger a restart
+SKIP_DIRS = (".git", "__pycache__", ".venv", ".pytest_cache", "node_modules")
+
+# Coalesce bursts of filesystem events (editors often emit several per save)
+DEBOUNCE_SECONDS = 0.5
+
 class DevHandler(FileSystemEventHandler):
     def __init__(self):
         self.process = None
+        self._restart_timer = None
+        self._lock = threading.Lock()
         self.restart_app()
-    
+
     def restart_app(self):
         """Restart the application"""
         if self.process:
@@ -25,33 +33,48 @@ class DevHandler(FileSystemEventHandler):
                 self.process.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 self.process.kill()
-        
+
         env = os.environ.copy()
         env["DEV_MODE"] = "true"
         env["DEBUG"] = "true"
-        
+
         print("🚀 Starting RAGSpace in development mode...")
         print("📝 Auto-reload enabled - changes to .py files will restart the server")
         print("🌐 Server will be available at: http://localhost:8000")
         print("🔧 MCP Server will be available at: http://localhost:8000/gradio_api/mcp/")
         print("⏹️  Press Ctrl+C to stop the server")
         print("-" * 60)
-        
+
         self.process = subprocess.Popen(
             [sys.executable, "app.py"],
             env=env
         )
-    
+
+    def _schedule_restart(self):
+        """Debounce restarts: reset the timer on each event so a burst of
+        writes results in a single restart once the burst settles"""
+        with self._lock:
+            if self._restart_timer:
+                self._restart_timer.cancel()
+            self._restart_timer = threading.Timer(DEBOUNCE_SECONDS, self.restart_app)
+            self._restart_timer.daemon = True
+            self._restart_timer.start()
+
     def on_modified(self, event):
         if event.is_directory:
             return
-        
+
         # Only watch Python files
         if not event.src_path.endswith('.py'):
             return
-        
+
+        # Ignore writes in VCS/cache/venv directories
+        parts = event.src_path.split(os.sep)
+        if any(part in SKIP_DIRS for part in parts):
+            return
+
         print(f"🔄 File changed: {event.src_path}")
-        self.restart_app()
+        self._schedule_restart()
 
 def main():
     """Main development server"""
@@ -59,17 +82,19 @@ def main():
     observer = Observer()
     observer.schedule(handler, path='.', recursive=True)
     observer.start()
-    
+
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         print("\n👋 Development server stopped")
     finally:
+        if handler._restart_timer:
+            handler._restart_timer.cancel()
         if handler.process:
             handler.process.terminate()
         observer.stop()
         observer.join()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
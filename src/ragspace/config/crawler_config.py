@@ -4,124 +4,222 @@ Centralized configuration for all crawlers using environment variables
 """
 
 import os
-from typing import Dict, Any, List
+import functools
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-class CrawlerConfig:
-    """Centralized crawler configuration"""
-    
-    @staticmethod
-    def get_github_config() -> Dict[str, Any]:
-        """Get GitHub crawler configuration from environment variables"""
-        return {
-            "token": os.getenv("GITHUB_TOKEN"),
-            "base_url": os.getenv("GITHUB_API_URL", "https://api.github.com"),
-            "user_agent": os.getenv("GITHUB_USER_AGENT", "RAGSpace/1.0"),
-            "file_types": _parse_list_env("GITHUB_FILE_TYPES", [
+
+@dataclass(frozen=True, slots=True)
+class CrawlerSettings:
+    """Immutable snapshot of all crawler settings, read from the environment once
+
+    frozen + slots gives lock-free sharing across threads, C-speed attribute
+    access, and no per-instance __dict__.
+    """
+
+    github_token: str
+    github_base_url: str
+    github_user_agent: str
+    github_file_types: Tuple[str, ...]
+    github_max_file_size: int
+    github_skip_patterns: Tuple[str, ...]
+    github_max_depth: int
+    github_rate_limit_warning: bool
+
+    website_max_depth: int
+    website_max_pages: int
+    website_skip_patterns: Tuple[str, ...]
+    website_content_selectors: Tuple[str, ...]
+    website_title_selectors: Tuple[str, ...]
+    website_user_agent: str
+    website_timeout: int
+    website_max_content_size: int
+
+    enable_logging: bool
+    log_level: str
+    default_timeout: int
+    retry_attempts: int
+    retry_delay: int
+
+    enable_mock: bool
+    mock_data_path: str
+    mock_response_delay: float
+
+    @classmethod
+    def from_env(cls) -> "CrawlerSettings":
+        """Read every crawler setting from os.environ in one pass"""
+        return cls(
+            github_token=os.getenv("GITHUB_TOKEN"),
+            github_base_url=os.getenv("GITHUB_API_URL", "https://api.github.com"),
+            github_user_agent=os.getenv("GITHUB_USER_AGENT", "RAGSpace/1.0"),
+            github_file_types=_parse_list_env("GITHUB_FILE_TYPES", [
                 ".md", ".py", ".js", ".ts", ".txt", ".rst", ".adoc", ".json", ".yaml", ".yml"
             ]),
-            "max_file_size": int(os.getenv("GITHUB_MAX_FILE_SIZE", "50000")),
-            "skip_patterns": _parse_list_env("GITHUB_SKIP_PATTERNS", [
+            github_max_file_size=int(os.getenv("GITHUB_MAX_FILE_SIZE", "50000")),
+            github_skip_patterns=_parse_list_env("GITHUB_SKIP_PATTERNS", [
                 "node_modules", ".git", "__pycache__", ".DS_Store", "*.pyc"
             ]),
-            "max_depth": int(os.getenv("GITHUB_MAX_DEPTH", "10")),
-            "rate_limit_warning": os.getenv("GITHUB_RATE_LIMIT_WARNING", "true").lower() == "true"
-        }
-    
-    @staticmethod
-    def get_website_config() -> Dict[str, Any]:
-        """Get website crawler configuration from environment variables"""
-        return {
-            "max_depth": int(os.getenv("WEBSITE_MAX_DEPTH", "3")),
-            "max_pages": int(os.getenv("WEBSITE_MAX_PAGES", "10")),
-            "skip_patterns": _parse_list_env("WEBSITE_SKIP_PATTERNS", [
+            github_max_depth=int(os.getenv("GITHUB_MAX_DEPTH", "10")),
+            github_rate_limit_warning=os.getenv("GITHUB_RATE_LIMIT_WARNING", "true").lower() == "true",
+            website_max_depth=int(os.getenv("WEBSITE_MAX_DEPTH", "3")),
+            website_max_pages=int(os.getenv("WEBSITE_MAX_PAGES", "10")),
+            website_skip_patterns=_parse_list_env("WEBSITE_SKIP_PATTERNS", [
                 "#", "javascript:", "mailto:", "tel:", "data:"
             ]),
-            "content_selectors": _parse_list_env("WEBSITE_CONTENT_SELECTORS", [
+            website_content_selectors=_parse_list_env("WEBSITE_CONTENT_SELECTORS", [
                 "main", "article", ".content", "#content", ".post", ".entry"
             ]),
-            "title_selectors": _parse_list_env("WEBSITE_TITLE_SELECTORS", [
+            website_title_selectors=_parse_list_env("WEBSITE_TITLE_SELECTORS", [
                 "h1", "title", ".title", ".headline"
             ]),
-            "user_agent": os.getenv("WEBSITE_USER_AGENT", "RAGSpace/1.0"),
-            "timeout": int(os.getenv("WEBSITE_TIMEOUT", "10")),
-            "max_content_size": int(os.getenv("WEBSITE_MAX_CONTENT_SIZE", "50000"))
+            website_user_agent=os.getenv("WEBSITE_USER_AGENT", "RAGSpace/1.0"),
+            website_timeout=int(os.getenv("WEBSITE_TIMEOUT", "10")),
+            website_max_content_size=int(os.getenv("WEBSITE_MAX_CONTENT_SIZE", "50000")),
+            enable_logging=os.getenv("CRAWLER_ENABLE_LOGGING", "true").lower() == "true",
+            log_level=os.getenv("CRAWLER_LOG_LEVEL", "INFO"),
+            default_timeout=int(os.getenv("CRAWLER_DEFAULT_TIMEOUT", "30")),
+            retry_attempts=int(os.getenv("CRAWLER_RETRY_ATTEMPTS", "3")),
+            retry_delay=int(os.getenv("CRAWLER_RETRY_DELAY", "1")),
+            enable_mock=os.getenv("CRAWLER_ENABLE_MOCK", "false").lower() == "true",
+            mock_data_path=os.getenv("CRAWLER_MOCK_DATA_PATH", ""),
+            mock_response_delay=float(os.getenv("CRAWLER_MOCK_DELAY", "0.1")),
+        )
+
+
+class CrawlerConfig:
+    """Centralized crawler configuration
+
+    The environment is read once into a frozen CrawlerSettings snapshot;
+    the dict-shaped getters below are cached views over it. Call
+    `reload()` after changing environment variables.
+    """
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def settings() -> CrawlerSettings:
+        """The process-wide settings snapshot"""
+        return CrawlerSettings.from_env()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_github_config() -> Dict[str, Any]:
+        """Get GitHub crawler configuration from environment variables"""
+        s = CrawlerConfig.settings()
+        return {
+            "token": s.github_token,
+            "base_url": s.github_base_url,
+            "user_agent": s.github_user_agent,
+            "file_types": s.github_file_types,
+            "max_file_size": s.github_max_file_size,
+            "skip_patterns": s.github_skip_patterns,
+            "max_depth": s.github_max_depth,
+            "rate_limit_warning": s.github_rate_limit_warning
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_website_config() -> Dict[str, Any]:
+        """Get website crawler configuration from environment variables"""
+        s = CrawlerConfig.settings()
+        return {
+            "max_depth": s.website_max_depth,
+            "max_pages": s.website_max_pages,
+            "skip_patterns": s.website_skip_patterns,
+            "content_selectors": s.website_content_selectors,
+            "title_selectors": s.website_title_selectors,
+            "user_agent": s.website_user_agent,
+            "timeout": s.website_timeout,
+            "max_content_size": s.website_max_content_size
         }
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_global_config() -> Dict[str, Any]:
         """Get global crawler configuration"""
+        s = CrawlerConfig.settings()
         return {
-            "enable_logging": os.getenv("CRAWLER_ENABLE_LOGGING", "true").lower() == "true",
-            "log_level": os.getenv("CRAWLER_LOG_LEVEL", "INFO"),
-            "default_timeout": int(os.getenv("CRAWLER_DEFAULT_TIMEOUT", "30")),
-            "retry_attempts": int(os.getenv("CRAWLER_RETRY_ATTEMPTS", "3")),
-            "retry_delay": int(os.getenv("CRAWLER_RETRY_DELAY", "1"))
+            "enable_logging": s.enable_logging,
+            "log_level": s.log_level,
+            "default_timeout": s.default_timeout,
+            "retry_attempts": s.retry_attempts,
+            "retry_delay": s.retry_delay
         }
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_mock_config() -> Dict[str, Any]:
         """Get mock crawler configuration for testing"""
+        s = CrawlerConfig.settings()
         return {
-            "enable_mock": os.getenv("CRAWLER_ENABLE_MOCK", "false").lower() == "true",
-            "mock_data_path": os.getenv("CRAWLER_MOCK_DATA_PATH", ""),
-            "mock_response_delay": float(os.getenv("CRAWLER_MOCK_DELAY", "0.1"))
+            "enable_mock": s.enable_mock,
+            "mock_data_path": s.mock_data_path,
+            "mock_response_delay": s.mock_response_delay
         }
-    
+
+    @classmethod
+    def reload(cls):
+        """Clear all cached configurations so they are re-read from os.environ"""
+        cls.settings.cache_clear()
+        cls.get_github_config.cache_clear()
+        cls.get_website_config.cache_clear()
+        cls.get_global_config.cache_clear()
+        cls.get_mock_config.cache_clear()
+
     @staticmethod
     def validate_config() -> List[str]:
         """Validate configuration and return any issues"""
         issues = []
-        
+
         # Check GitHub configuration
-        github_config = CrawlerConfig.get_github_config()
-        if github_config["max_file_size"] <= 0:
+        s = CrawlerConfig.settings()
+        if s.github_max_file_size <= 0:
             issues.append("GITHUB_MAX_FILE_SIZE must be positive")
-        if github_config["max_depth"] <= 0:
+        if s.github_max_depth <= 0:
             issues.append("GITHUB_MAX_DEPTH must be positive")
-        
+
         # Check website configuration
-        website_config = CrawlerConfig.get_website_config()
-        if website_config["max_depth"] <= 0:
+        if s.website_max_depth <= 0:
             issues.append("WEBSITE_MAX_DEPTH must be positive")
-        if website_config["max_pages"] <= 0:
+        if s.website_max_pages <= 0:
             issues.append("WEBSITE_MAX_PAGES must be positive")
-        if website_config["timeout"] <= 0:
+        if s.website_timeout <= 0:
             issues.append("WEBSITE_TIMEOUT must be positive")
-        
+
         return issues
-    
+
     @staticmethod
     def get_config_summary() -> Dict[str, Any]:
         """Get a summary of all crawler configurations"""
+        s = CrawlerConfig.settings()
         return {
             "github": {
-                "has_token": bool(CrawlerConfig.get_github_config()["token"]),
-                "max_file_size": CrawlerConfig.get_github_config()["max_file_size"],
-                "max_depth": CrawlerConfig.get_github_config()["max_depth"],
-                "file_types": len(CrawlerConfig.get_github_config()["file_types"])
+                "has_token": bool(s.github_token),
+                "max_file_size": s.github_max_file_size,
+                "max_depth": s.github_max_depth,
+                "file_types": len(s.github_file_types)
             },
             "website": {
-                "max_depth": CrawlerConfig.get_website_config()["max_depth"],
-                "max_pages": CrawlerConfig.get_website_config()["max_pages"],
-                "timeout": CrawlerConfig.get_website_config()["timeout"]
+                "max_depth": s.website_max_depth,
+                "max_pages": s.website_max_pages,
+                "timeout": s.website_timeout
             },
             "global": {
-                "enable_logging": CrawlerConfig.get_global_config()["enable_logging"],
-                "log_level": CrawlerConfig.get_global_config()["log_level"]
+                "enable_logging": s.enable_logging,
+                "log_level": s.log_level
             }
         }
 
 
-def _parse_list_env(env_var: str, default: List[str]) -> List[str]:
-    """Parse environment variable as comma-separated list"""
+def _parse_list_env(env_var: str, default: List[str]) -> Tuple[str, ...]:
+    """Parse environment variable as comma-separated list (returned as an immutable tuple)"""
     value = os.getenv(env_var)
     if value:
-        return [item.strip() for item in value.split(",") if item.strip()]
-    return default
+        return tuple(item.strip() for item in value.split(",") if item.strip())
+    return tuple(default)
 
 
 def _parse_int_env(env_var: str, default: int) -> int:
@@ -140,4 +238,4 @@ def _parse_bool_env(env_var: str, default: bool) -> bool:
     value = os.getenv(env_var)
     if value:
         return value.lower() in ("true", "1", "yes", "on")
-    return default 
\ No newline at end of file
+    return default
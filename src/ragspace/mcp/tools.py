@@ -2,38 +2,64 @@
 MCP Tools for RAGSpace - External Interface Only
 """
 
+import functools
+
 import gradio as gr
 
+from src.ragspace import storage
+
 def get_docset_manager():
     """Get the current docset manager"""
-    from src.ragspace.storage import docset_manager
-    return docset_manager
+    # Looked up on the storage module each call so use_mock()/use_supabase()
+    # swaps are picked up
+    return storage.docset_manager
 
+@functools.lru_cache(maxsize=1)
 def get_rag_manager():
-    """Get the RAG manager"""
+    """Get the RAG manager (constructed once and reused across MCP calls)"""
     from src.ragspace.services.rag import RAGManager
     return RAGManager()
 
-def list_docsets():
+# Cached rendering of list_docsets: (manager, version, rendered result).
+# Valid while the manager instance and its mutation counter are unchanged.
+_list_cache = None
+
+def list_docsets() -> str:
     """List all docsets - MCP tool interface"""
+    global _list_cache
     try:
         docset_manager = get_docset_manager()
-        docsets = docset_manager.get_docsets_dict()
-        if not docsets:
+        version = getattr(docset_manager, "_version", None)
+        if (version is not None and _list_cache is not None
+                and _list_cache[0] is docset_manager and _list_cache[1] == version):
+            return _list_cache[2]
+
+        # Prefer the manager's hot (name, description) column over building
+        # the full docsets dict just to render a listing
+        name_desc = getattr(docset_manager, "_name_desc_index", None)
+        if name_desc is None:
+            docsets = docset_manager.get_docsets_dict()
+            name_desc = [(name, docset.get('description'))
+                         for name, docset in docsets.items()]
+        if not name_desc:
             return "No docsets found."
-        
-        result = "Available DocSets:\n"
-        for name, docset in docsets.items():
-            result += f"- {name}"
-            if docset.get('description'):
-                result += f": {docset['description']}"
-            result += "\n"
-        
+
+        # Build the lines once and join, instead of string += per docset
+        parts = ["Available DocSets:"]
+        for name, description in name_desc:
+            if description:
+                parts.append(f"- {name}: {description}")
+            else:
+                parts.append(f"- {name}")
+        result = "\n".join(parts) + "\n"
+
+        if version is not None:
+            _list_cache = (docset_manager, version, result)
         return result
     except Exception as e:
         return f"Error listing docsets: {str(e)}"
 
-def ask(query: str, docset: str = None):
+def ask(query: str, docset: str = None) -> str:
     """Query the knowledge base using RAG - MCP tool interface
     Args:
         query: The query to ask, in natural language
@@ -67,23 +93,7 @@ def ask(query: str, docset: str = None):
     
 def expose_mcp_tools():
     """Expose MCP tools - External interface only"""
-    # List docsets tool
-    hidden_btn_list_docsets = gr.Button("hidden", render=False)
-    hidden_btn_list_docsets.click(
-        fn=list_docsets,
-        inputs=[],
-        outputs=gr.Textbox(label="DocSets", visible=False),
-        api_name="list_docsets"
-    )
-    
-    # Ask tool
-    hidden_btn_ask = gr.Button("hidden", render=False)
-    hidden_btn_ask.click(
-        fn=ask,
-        inputs=[
-            gr.Textbox(label="Query", visible=False),
-            gr.Textbox(label="DocSet (optional)", visible=False)
-        ],
-        outputs=gr.Textbox(label="Answer", visible=False),
-        api_name="ask"
-    )
+    # API-only endpoints: no hidden Button/Textbox components in the page
+    # bundle and no event-queue subscriptions per client
+    gr.api(list_docsets, api_name="list_docsets")
+    gr.api(ask, api_name="ask")
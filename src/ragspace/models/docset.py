@@ -2,13 +2,25 @@
 DocSet model for RAGSpace
 """
 
+import re
 import time
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from .document import Document
 
+# Tokenizer shared by indexing and querying
+_TOKEN_RE = re.compile(r"\w+")
+
 class DocSet:
-    """Represents a collection of documents"""
-    
+    """Represents a collection of documents
+
+    An inverted token index is maintained on insert so searches resolve
+    candidates with set intersections instead of re-lowering and scanning
+    every document per query.
+    """
+
+    __slots__ = ("name", "description", "documents", "metadata",
+                 "_token_index", "_postings_cache", "_by_id", "_next_id")
+
     def __init__(self, name: str, description: str = ""):
         self.name = name
         self.description = description
@@ -17,32 +29,80 @@ class DocSet:
             "created_at": time.time(),
             "updated_at": time.time()
         }
-    
+        # token -> set of document ids containing that token
+        self._token_index = {}
+        # id -> document, so lookups don't walk the documents list
+        self._by_id = {}
+        # Monotonic id counter; avoids coupling ids to list length
+        self._next_id = 0
+        # query token -> widened posting set (cleared whenever the
+        # vocabulary changes), so repeated queries skip the vocabulary scan
+        self._postings_cache = {}
+
+    def _index_document(self, doc: Document) -> None:
+        """Assign an id to a document and add it to the indexes"""
+        self._next_id += 1
+        doc.id = self._next_id
+        # Lowered text is cached on the Document at construction time
+        for token in _TOKEN_RE.findall(doc._content_lower):
+            self._token_index.setdefault(token, set()).add(doc.id)
+        for token in _TOKEN_RE.findall(doc._title_lower):
+            self._token_index.setdefault(token, set()).add(doc.id)
+        self.documents.append(doc)
+        self._by_id[doc.id] = doc
+
     def add_document(self, doc: Document) -> None:
         """Add a document to this docset"""
-        doc.id = len(self.documents) + 1
-        self.documents.append(doc)
+        self._index_document(doc)
+        self._postings_cache.clear()
         self.metadata["updated_at"] = time.time()
-    
+
+    def add_documents(self, docs: Iterable[Document]) -> None:
+        """Add a batch of documents, stamping updated_at once at the end"""
+        for doc in docs:
+            self._index_document(doc)
+        self._postings_cache.clear()
+        self.metadata["updated_at"] = time.time()
+
     def get_document_by_id(self, doc_id: int) -> Optional[Document]:
         """Get a document by its ID"""
-        for doc in self.documents:
-            if doc.id == doc_id:
-                return doc
-        return None
-    
+        return self._by_id.get(doc_id)
+
     def search_documents(self, query: str) -> List[Document]:
         """Search documents in this docset"""
-        results = []
         query_lower = query.lower()
-        for doc in self.documents:
-            if (query_lower in doc.content.lower() or 
-                query_lower in doc.title.lower()):
-                results.append(doc)
-        return results
-    
+        tokens = _TOKEN_RE.findall(query_lower)
+
+        if tokens:
+            # Intersect posting sets for candidate ids. A query token may
+            # also match inside a longer indexed token ("python" in
+            # "pythonic"), so each lookup unions the postings of every
+            # vocabulary entry containing it; the resulting candidate set is
+            # a superset of the true matches, confirmed below.
+            candidate_ids = None
+            for token in tokens:
+                postings = self._postings_cache.get(token)
+                if postings is None:
+                    postings = set()
+                    for indexed_token, ids in self._token_index.items():
+                        if token in indexed_token:
+                            postings |= ids
+                    self._postings_cache[token] = postings
+                candidate_ids = postings if candidate_ids is None else candidate_ids & postings
+                if not candidate_ids:
+                    break
+            candidates = [doc for doc in self.documents if doc.id in candidate_ids]
+        else:
+            # No word characters in the query; scan the cached lowered text
+            candidates = self.documents
+
+        return [
+            doc for doc in candidates
+            if query_lower in doc._content_lower or query_lower in doc._title_lower
+        ]
+
     def __str__(self) -> str:
         return f"DocSet(name='{self.name}', documents={len(self.documents)})"
-    
+
     def __repr__(self) -> str:
-        return self.__str__() 
\ No newline at end of file
+        return self.__str__()
@@ -6,13 +6,21 @@ from typing import Dict, Any, Optional
 
 class Document:
     """Represents a document in a DocSet"""
-    
+
+    # Slots avoid a per-instance __dict__ (~hundreds of bytes each), which
+    # adds up when a crawl produces tens of thousands of documents
+    __slots__ = ("title", "content", "doc_type", "metadata", "id",
+                 "_title_lower", "_content_lower")
+
     def __init__(self, title: str, content: str, doc_type: str = "file", metadata: Optional[Dict[str, Any]] = None):
         self.title = title
         self.content = content
         self.doc_type = doc_type  # "file", "website", "github"
         self.metadata = metadata or {}
         self.id = None  # Will be set when added to docset
+        # Lowered text computed once here so searches never re-allocate it
+        self._title_lower = title.lower()
+        self._content_lower = content.lower()
     
     def __str__(self) -> str:
         return f"Document(title='{self.title}', type='{self.doc_type}', id={self.id})"
@@ -2,50 +2,44 @@
 Services Module
 
 This module contains all services for RAGSpace, organized by functionality.
+Attributes are resolved lazily (PEP 562) so importing a crawler does not
+pull in the RAG stack and vice versa.
 """
 
-# Import crawler services
-from .crawler import (
-    CrawlerInterface,
-    CrawlResult,
-    CrawledItem, 
-    ContentType,
-    CrawlerRegistry,
-    crawler_registry,
-    GitHubCrawler,
-    WebsiteCrawler,
-    MockCrawler,
-    GitHubService,
-    register_default_crawlers
-)
+import importlib
 
-# Import RAG services
-from .rag import (
-    RAGManager,
-    RAGRetriever,
-    RAGResponseGenerator,
-    EmbeddingWorker,
-    RAGTextSplitter
-)
-
-__all__ = [
+# Attribute name -> submodule that provides it
+_LAZY_IMPORTS = {
     # Crawler services
-    'CrawlerInterface',
-    'CrawlResult',
-    'CrawledItem',
-    'ContentType', 
-    'CrawlerRegistry',
-    'crawler_registry',
-    'GitHubCrawler',
-    'WebsiteCrawler',
-    'MockCrawler',
-    'GitHubService',
-    'register_default_crawlers',
-    
+    'CrawlerInterface': '.crawler',
+    'CrawlResult': '.crawler',
+    'CrawledItem': '.crawler',
+    'ContentType': '.crawler',
+    'CrawlerRegistry': '.crawler',
+    'crawler_registry': '.crawler',
+    'GitHubCrawler': '.crawler',
+    'WebsiteCrawler': '.crawler',
+    'MockCrawler': '.crawler',
+    'GitHubService': '.crawler',
+    'register_default_crawlers': '.crawler',
+
     # RAG services
-    'RAGManager',
-    'RAGRetriever',
-    'RAGResponseGenerator',
-    'EmbeddingWorker',
-    'RAGTextSplitter'
-] 
\ No newline at end of file
+    'RAGManager': '.rag',
+    'RAGRetriever': '.rag',
+    'RAGResponseGenerator': '.rag',
+    'EmbeddingWorker': '.rag',
+    'RAGTextSplitter': '.rag',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Resolve service classes on first access instead of at import time"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,36 @@
+"""
+Shared GitHub URL parsing for crawler services
+
+Both GitHubCrawler and GitHubService previously carried their own copy of
+the startswith/replace/split parsing chain; this module replaces them with
+one compiled regex pass.
+"""
+
+import re
+from typing import Tuple
+
+# Optional scheme and github.com host, then owner/repo with any trailing
+# ".git" or slash stripped
+_GH_URL_RE = re.compile(
+    r"^(?:(?:https?://)?(?:www\.)?github\.com/)?"
+    r"([^/\s]+)/([^/\s#?]+?)(?:\.git)?/?$",
+    re.IGNORECASE
+)
+
+
+def parse_repo_url(url: str) -> Tuple[str, str]:
+    """Extract (owner, repo) from a GitHub repository URL
+
+    Accepts full URLs, host-prefixed paths, and bare "owner/repo" forms.
+    Raises ValueError for anything else.
+    """
+    match = _GH_URL_RE.match(url.strip())
+    if not match:
+        raise ValueError(f"Invalid GitHub repository URL: {url}")
+
+    owner, repo = match.group(1), match.group(2)
+    # A bare host with a single path segment ("github.com/owner") matches
+    # the hostless branch; reject it explicitly
+    if owner.lower() in ("github.com", "www.github.com"):
+        raise ValueError(f"Invalid GitHub repository URL: {url}")
+    return owner, repo
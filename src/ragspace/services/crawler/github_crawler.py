@@ -2,21 +2,99 @@
 GitHub repository crawler implementation
 """
 
-import os
 import re
 import base64
+import functools
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import logging
 
 from ...config.crawler_config import CrawlerConfig
+from ._gh_url import parse_repo_url
 from .crawler_interface import (
     CrawlerInterface, CrawlResult, CrawledItem, ContentType
 )
 
 logger = logging.getLogger(__name__)
 
+# Hosts recognized as pointing at a GitHub repository
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+
+# Total content bytes the ETag cache may hold before evicting its least
+# recently used entries; keeps long-lived crawler instances from pinning
+# every crawled repo in memory
+_ETAG_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_skip_matcher(patterns: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+    """Split skip patterns into literal substrings and one alternation regex
+
+    Most configured patterns are fixed names like "node_modules" or
+    ".git"; those are matched with C-level `in` checks against the
+    lowercased path. Only patterns containing wildcards go through the
+    combined regex. Invalid patterns are dropped with a warning.
+    """
+    literals = []
+    parts = []
+    for pattern in patterns:
+        if '*' not in pattern and '?' not in pattern:
+            literals.append(pattern.lower())
+            continue
+        # Convert shell wildcard patterns to regex patterns
+        regex_pattern = re.escape(pattern).replace(r'\*', '.*').replace(r'\?', '.')
+        try:
+            re.compile(regex_pattern)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+            continue
+        parts.append(f"(?:{regex_pattern})")
+
+    regex = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+    return tuple(literals), regex
+
+
+def _skip_match(literals: Tuple[str, ...], regex: Optional[re.Pattern], path: str) -> bool:
+    """Check a path against the split literal/regex skip matchers"""
+    path_lower = path.lower()
+    if any(literal in path_lower for literal in literals):
+        return True
+    return bool(regex and regex.search(path))
+
+# Extension -> content type lookup table: one hash lookup per file instead
+# of a chain of endswith scans
+_EXT_TO_CONTENT_TYPE = {
+    # Code files
+    **{ext: ContentType.CODE for ext in (
+        '.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt'
+    )},
+    # Documentation files
+    **{ext: ContentType.DOCUMENTATION for ext in ('.md', '.txt', '.rst', '.adoc')},
+    # Configuration files
+    **{ext: ContentType.CONFIGURATION for ext in ('.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf')},
+    # Data files
+    **{ext: ContentType.DATA for ext in ('.csv', '.tsv', '.xml', '.sql')},
+    # Image files
+    **{ext: ContentType.IMAGE for ext in ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')},
+    # Binary files
+    **{ext: ContentType.BINARY for ext in ('.exe', '.dll', '.so', '.dylib', '.bin')},
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _content_type_for(file_name_lower: str) -> ContentType:
+    """Resolve a (lowercased) file name to its content type"""
+    dot = file_name_lower.rfind('.')
+    if dot == -1:
+        return ContentType.UNKNOWN
+    return _EXT_TO_CONTENT_TYPE.get(file_name_lower[dot:], ContentType.UNKNOWN)
+
+
 class GitHubCrawler(CrawlerInterface):
     """GitHub repository crawler implementation"""
     
@@ -49,22 +127,90 @@ class GitHubCrawler(CrawlerInterface):
             "skip_patterns": github_config["skip_patterns"],
             "max_depth": github_config["max_depth"]
         })
-    
+
+        # Precompile the skip patterns once; should_skip_item recompiles
+        # only if the config is swapped out afterwards
+        self._skip_patterns = tuple(self.config.get("skip_patterns", ()))
+        self._skip_literals, self._skip_re = _compile_skip_matcher(self._skip_patterns)
+
+        # One pooled session for all API calls: connections (and their TLS
+        # handshakes) are reused across requests, with retries on transient
+        # gateway errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+
+        # ETag cache for conditional GETs: url -> (etag, content). A 304
+        # response carries no body and is not charged against the rate
+        # limit, so re-crawls of unchanged files become near-free. LRU,
+        # bounded by total content bytes (the instance is process-wide
+        # via the registry, so an unbounded cache would grow forever).
+        self._etag_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._etag_cache_bytes = 0
+
+    def _etag_cache_get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Look up a cached (etag, content) pair, marking it recently used"""
+        cached = self._etag_cache.get(url)
+        if cached is not None:
+            self._etag_cache.move_to_end(url)
+        return cached
+
+    def _etag_cache_put(self, url: str, etag: str, content: str) -> None:
+        """Store a pair, evicting least recently used entries past the byte cap"""
+        size = len(content)
+        if size > _ETAG_CACHE_MAX_BYTES:
+            # A single oversized file would evict everything else and
+            # still not fit
+            return
+
+        old = self._etag_cache.pop(url, None)
+        if old is not None:
+            self._etag_cache_bytes -= len(old[1])
+
+        self._etag_cache[url] = (etag, content)
+        self._etag_cache_bytes += size
+
+        while self._etag_cache_bytes > _ETAG_CACHE_MAX_BYTES:
+            _, (_, evicted_content) = self._etag_cache.popitem(last=False)
+            self._etag_cache_bytes -= len(evicted_content)
+
+    def _split_github_path(self, url: str) -> Optional[Tuple[str, str]]:
+        """Extract (owner, repo) if the URL points at a GitHub repository
+
+        One urlparse/split pass shared by can_handle and preprocess_url,
+        replacing the previous case-sensitive startswith chains.
+        """
+        url = url.strip()
+        lower = url.lower()
+
+        if "://" in url:
+            parsed = urlparse(url)
+            if parsed.netloc.lower() not in _GITHUB_HOSTS:
+                return None
+            path = parsed.path
+        elif lower.startswith(("github.com/", "www.github.com/")):
+            path = url.split("/", 1)[1]
+        else:
+            # Bare owner/repo shorthand
+            parts = url.split("/")
+            if len(parts) == 2 and parts[0] and parts[1] and "." not in parts[0]:
+                return parts[0], parts[1]
+            return None
+
+        parts = [part for part in path.split("/") if part]
+        if len(parts) >= 2:
+            return parts[0], parts[1]
+        return None
+
     def can_handle(self, url: str) -> bool:
         """Check if this crawler can handle the given URL"""
-        url_lower = url.lower()
-        
-        # Handle different URL formats
-        if url_lower.startswith(("https://github.com/", "github.com/")):
-            return True
-        elif "/" in url and not url_lower.startswith("http"):
-            # Check if it looks like owner/repo format
-            parts = url.split("/")
-            if len(parts) == 2 and not "." in parts[0]:
-                return True
-        
-        return False
-    
+        return self._split_github_path(url) is not None
+
     def get_supported_url_patterns(self) -> List[str]:
         """Return list of supported URL patterns"""
         return [
@@ -74,39 +220,14 @@ class GitHubCrawler(CrawlerInterface):
     
     def preprocess_url(self, url: str) -> str:
         """Normalize GitHub URL format"""
-        url = url.strip()
-        
-        # Handle different URL formats
-        if url.startswith("https://github.com/"):
-            return url
-        elif url.startswith("github.com/"):
-            return f"https://{url}"
-        elif "/" in url and not url.startswith("http"):
-            return f"https://github.com/{url}"
-        
+        parts = self._split_github_path(url)
+        if parts:
+            return f"https://github.com/{parts[0]}/{parts[1]}"
         return url
     
     def parse_repo_url(self, repo_url: str) -> tuple[str, str]:
         """Parse GitHub repository URL to extract owner and repo name"""
-        try:
-            # Handle different URL formats
-            if repo_url.startswith("https://github.com/"):
-                path = repo_url.replace("https://github.com/", "").rstrip("/")
-            elif repo_url.startswith("github.com/"):
-                path = repo_url.replace("github.com/", "").rstrip("/")
-            else:
-                path = repo_url.rstrip("/")
-            
-            # Split into owner and repo
-            parts = path.split("/")
-            if len(parts) != 2:
-                raise ValueError(f"Invalid GitHub repository URL: {repo_url}")
-            
-            owner, repo = parts
-            return owner, repo
-            
-        except Exception as e:
-            raise ValueError(f"Failed to parse GitHub URL '{repo_url}': {str(e)}")
+        return parse_repo_url(repo_url)
 
     def get_repo_contents(self, owner: str, repo: str, path: str = "", branch: str = "main") -> List[Dict]:
         """Get contents of a GitHub repository directory"""
@@ -114,7 +235,7 @@ class GitHubCrawler(CrawlerInterface):
             url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
             params = {"ref": branch}
             
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             
             return response.json()
@@ -124,83 +245,169 @@ class GitHubCrawler(CrawlerInterface):
             return []
 
     def get_file_content(self, owner: str, repo: str, path: str, branch: str = "main") -> str:
-        """Get content of a specific file from GitHub"""
+        """Get content of a specific file from GitHub
+
+        Fetches from raw.githubusercontent.com, which serves the bytes
+        directly instead of a base64-wrapped JSON envelope (~33% less
+        bandwidth, no decode step). Falls back to the contents API if the
+        raw host refuses the request.
+        """
+        try:
+            url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+
+            cached = self._etag_cache_get(url)
+            headers = {"If-None-Match": cached[0]} if cached else None
+            response = self.session.get(url, stream=True, timeout=10, headers=headers)
+
+            if response.status_code == 304:
+                return cached[1]
+            if response.status_code != 200:
+                return self._get_file_content_via_api(owner, repo, path, branch)
+
+            # Stream with a hard byte cap: if the advertised size was stale
+            # and the body overruns max_file_size, abort mid-transfer
+            # instead of buffering the whole payload
+            max_size = self.config.get("max_file_size", 1024 * 1024)
+            buf = bytearray()
+            for chunk in response.iter_content(64 * 1024):
+                # Sniff binaries that slip past the extension filter: a NUL
+                # byte in the first chunk means this is not text
+                if not buf and b"\x00" in chunk:
+                    response.close()
+                    logger.warning(f"File {path} looks binary, skipping")
+                    return ""
+                buf += chunk
+                if len(buf) > max_size:
+                    response.close()
+                    logger.warning(f"File {path} exceeded max_file_size mid-transfer, skipping")
+                    return ""
+            content = buf.decode("utf-8", errors="replace")
+
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache_put(url, etag, content)
+            return content
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to get file content: {e}")
+            return ""
+
+    def _get_file_content_via_api(self, owner: str, repo: str, path: str, branch: str = "main") -> str:
+        """Get file content via the contents API (base64-wrapped JSON)"""
         try:
             url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
             params = {"ref": branch}
-            
-            response = requests.get(url, headers=self.headers, params=params)
+
+            response = self.session.get(url, params=params)
             response.raise_for_status()
-            
+
             content_data = response.json()
-            
+
             # Decode content
             if content_data.get("encoding") == "base64":
                 content = base64.b64decode(content_data["content"]).decode("utf-8")
                 return content
             else:
                 return content_data.get("content", "")
-                
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get file content: {e}")
             return ""
 
+    def get_repo_tree(self, owner: str, repo: str, branch: str = "main") -> Optional[Dict]:
+        """Get the full repository tree in a single API call
+
+        Uses `GET /git/trees/{branch}?recursive=1`, which returns every
+        entry in the repository at once instead of one request per
+        directory.
+        """
+        try:
+            url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{branch}"
+            params = {"recursive": "1"}
+
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+
+            return response.json()
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to get repo tree: {e}")
+            return None
+
     def get_repo_files(self, owner: str, repo: str, branch: str = "main") -> List[Dict]:
         """Get all files from a GitHub repository"""
+        tree = self.get_repo_tree(owner, repo, branch)
+
+        if tree is None:
+            # Tree API unavailable (e.g. empty repo); fall back to the
+            # per-directory contents walk
+            return self._get_repo_files_via_contents(owner, repo, branch)
+
+        if tree.get("truncated"):
+            # The tree was too large for a single response; the contents
+            # walk is slower but complete
+            logger.warning(f"Repo tree for {owner}/{repo} truncated, falling back to directory traversal")
+            return self._get_repo_files_via_contents(owner, repo, branch)
+
+        max_file_size = self.config.get("max_file_size", 1024 * 1024)
         files = []
-        
-        def traverse_directory(path: str = ""):
-            """Recursively traverse repository directory"""
-            try:
-                contents = self.get_repo_contents(owner, repo, path, branch)
-                
-                for item in contents:
-                    if item["type"] == "file":
-                        # Check file size limit
-                        if item.get("size", 0) <= self.config.get("max_file_size", 1024 * 1024):
-                            files.append({
-                                "name": item["name"],
-                                "path": item["path"],
-                                "size": item.get("size", 0),
-                                "type": item["type"],
-                                "url": item["url"],
-                                "download_url": item.get("download_url")
-                            })
-                    elif item["type"] == "dir":
-                        # Recursively traverse subdirectories
-                        traverse_directory(item["path"])
-                        
-            except Exception as e:
-                logger.error(f"Failed to traverse directory {path}: {e}")
-        
-        # Start traversal from root
-        traverse_directory()
+        for entry in tree.get("tree", []):
+            if entry.get("type") != "blob":
+                continue
+            if entry.get("size", 0) > max_file_size:
+                continue
+            path = entry["path"]
+            files.append({
+                "name": path.rsplit("/", 1)[-1],
+                "path": path,
+                "size": entry.get("size", 0),
+                "type": "file",
+                "url": entry.get("url"),
+                "download_url": f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+            })
+        return files
+
+    def _get_repo_files_via_contents(self, owner: str, repo: str, branch: str = "main") -> List[Dict]:
+        """Collect repository files via the contents API (one request per directory)
+
+        Iterative breadth-first walk over an explicit deque: no recursion
+        frames, and failed directories are counted instead of silently
+        swallowed one try/except at a time.
+        """
+        files = []
+        max_file_size = self.config.get("max_file_size", 1024 * 1024)
+        failed_dirs = 0
+
+        pending = deque([""])
+        while pending:
+            path = pending.popleft()
+            contents = self.get_repo_contents(owner, repo, path, branch)
+            if not contents:
+                failed_dirs += 1
+                continue
+
+            for item in contents:
+                if item["type"] == "file":
+                    # Check file size limit
+                    if item.get("size", 0) <= max_file_size:
+                        files.append({
+                            "name": item["name"],
+                            "path": item["path"],
+                            "size": item.get("size", 0),
+                            "type": item["type"],
+                            "url": item["url"],
+                            "download_url": item.get("download_url")
+                        })
+                elif item["type"] == "dir":
+                    pending.append(item["path"])
+
+        if failed_dirs:
+            logger.warning(f"Failed to list {failed_dirs} directories in {owner}/{repo}")
         return files
 
     def determine_content_type(self, file_name: str) -> ContentType:
         """Determine content type based on file extension"""
-        file_lower = file_name.lower()
-        
-        # Code files
-        if file_lower.endswith(('.py', '.js', '.ts', '.java', '.cpp', '.c', '.h', '.cs', '.php', '.rb', '.go', '.rs', '.swift', '.kt')):
-            return ContentType.CODE
-        # Documentation files
-        elif file_lower.endswith(('.md', '.txt', '.rst', '.adoc')):
-            return ContentType.DOCUMENTATION
-        # Configuration files
-        elif file_lower.endswith(('.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf')):
-            return ContentType.CONFIGURATION
-        # Data files
-        elif file_lower.endswith(('.csv', '.tsv', '.xml', '.sql')):
-            return ContentType.DATA
-        # Image files
-        elif file_lower.endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')):
-            return ContentType.IMAGE
-        # Binary files
-        elif file_lower.endswith(('.exe', '.dll', '.so', '.dylib', '.bin')):
-            return ContentType.BINARY
-        else:
-            return ContentType.UNKNOWN
+        return _content_type_for(file_name.lower())
 
     def crawl(self, url: str, **kwargs) -> CrawlResult:
         """Crawl a GitHub repository"""
@@ -232,51 +439,29 @@ class GitHubCrawler(CrawlerInterface):
                     }
                 )
             
-            # Process files and create crawled items
+            # Filter on metadata (path, size, extension) before fetching any
+            # content, so skipped files never cost an HTTP round trip
+            candidates = [f for f in files if not self.should_skip_metadata(f)]
+
+            # Fetch and build items concurrently: each worker does one HTTP
+            # round trip plus the item construction/skip checks, so both the
+            # network wait and the post-fetch work overlap across files
+            def fetch_and_build(file_info) -> Optional[CrawledItem]:
+                content = self.get_file_content(owner, repo, file_info["path"], branch)
+                if not content:
+                    return None
+                return self._build_item(owner, repo, branch, file_info, content)
+
             items = []
-            processed_count = 0
-            skipped_count = 0
-            
-            for file_info in files:
-                try:
-                    # Get file content
-                    content = self.get_file_content(owner, repo, file_info["path"], branch)
-                    
-                    if not content:
-                        skipped_count += 1
-                        continue
-                    
-                    # Determine content type
-                    content_type = self.determine_content_type(file_info["name"])
-                    
-                    # Create crawled item with owner/repo prefix to avoid conflicts across repositories
-                    item = CrawledItem(
-                        title=f"{owner}/{repo}/{file_info['path']}",  # Add owner/repo prefix to avoid conflicts
-                        content=content,
-                        url=file_info["download_url"] or file_info["url"],
-                        content_type=content_type,
-                        metadata={
-                            "owner": owner,
-                            "repo": repo,
-                            "branch": branch,
-                            "path": file_info["path"],
-                            "size": file_info["size"],
-                            "file_type": file_info["name"].split(".")[-1] if "." in file_info["name"] else None
-                        }
-                    )
-                    
-                    # Check if item should be skipped
-                    if not self.should_skip_item(item):
-                        items.append(item)
-                        processed_count += 1
-                    else:
-                        skipped_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to process file {file_info['path']}: {e}")
-                    skipped_count += 1
-                    continue
-            
+            if candidates:
+                max_workers = min(32, len(candidates))
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    items = [item for item in pool.map(fetch_and_build, candidates)
+                             if item is not None]
+
+            processed_count = len(items)
+            skipped_count = len(files) - processed_count
+
             logger.info(f"✅ Crawled {processed_count} files, skipped {skipped_count} files")
             
             return CrawlResult(
@@ -302,20 +487,108 @@ class GitHubCrawler(CrawlerInterface):
                 metadata={}
             )
 
+    def _build_item(self, owner: str, repo: str, branch: str, file_info: Dict, content: str) -> Optional[CrawledItem]:
+        """Build a CrawledItem from a fetched file, or None if it is skipped"""
+        try:
+            # Parse the extension once and derive both the content type and
+            # the file_type metadata from it
+            name = file_info["name"]
+            dot = name.rfind(".")
+            file_type = name[dot + 1:] if dot != -1 else None
+            content_type = (_EXT_TO_CONTENT_TYPE.get(name[dot:].lower(), ContentType.UNKNOWN)
+                            if dot != -1 else ContentType.UNKNOWN)
+
+            # Create crawled item with owner/repo prefix to avoid conflicts across repositories
+            item = CrawledItem(
+                title=f"{owner}/{repo}/{file_info['path']}",  # Add owner/repo prefix to avoid conflicts
+                content=content,
+                url=file_info["download_url"] or file_info["url"],
+                content_type=content_type,
+                metadata={
+                    "owner": owner,
+                    "repo": repo,
+                    "branch": branch,
+                    "path": file_info["path"],
+                    "size": file_info["size"],
+                    "file_type": file_type
+                }
+            )
+
+            # Check if item should be skipped
+            if self.should_skip_item(item):
+                return None
+            return item
+
+        except Exception as e:
+            logger.error(f"Failed to process file {file_info['path']}: {e}")
+            return None
+
+    def _current_skip_matchers(self) -> Tuple[Tuple[str, ...], Optional[re.Pattern]]:
+        """Return the compiled skip matchers, refreshing them if the config was replaced"""
+        patterns = tuple(self.config.get("skip_patterns", ()))
+        if patterns != self._skip_patterns:
+            self._skip_patterns = patterns
+            self._skip_literals, self._skip_re = _compile_skip_matcher(patterns)
+        return self._skip_literals, self._skip_re
+
+    def should_skip_metadata(self, file_info: Dict) -> bool:
+        """Decide from tree metadata alone whether a file should be skipped
+
+        Mirrors the checks in should_skip_item but runs before any content
+        fetch, so discarded files cost no HTTP round trip.
+        """
+        literals, skip_re = self._current_skip_matchers()
+        if _skip_match(literals, skip_re, file_info.get("path", "")):
+            return True
+
+        max_size = self.config.get("max_file_size", 1024 * 1024)
+        if file_info.get("size", 0) > max_size:
+            return True
+
+        if self.determine_content_type(file_info.get("name", "")) == ContentType.BINARY:
+            return True
+
+        return False
+
+    def iter_crawl(self, url: str, **kwargs) -> Iterator[CrawledItem]:
+        """Yield crawled items as their fetches complete
+
+        Streaming counterpart to crawl(): the consumer can chunk, embed,
+        and store each file while later fetches are still in flight, so
+        only the in-flight items are held in memory instead of the whole
+        repository. Yield order follows fetch completion, not listing
+        order.
+        """
+        processed_url = self.preprocess_url(url)
+        owner, repo = self.parse_repo_url(processed_url)
+        branch = kwargs.get("branch", "main")
+
+        files = self.get_repo_files(owner, repo, branch)
+        candidates = [f for f in files if not self.should_skip_metadata(f)]
+        if not candidates:
+            return
+
+        def fetch_and_build(file_info) -> Optional[CrawledItem]:
+            content = self.get_file_content(owner, repo, file_info["path"], branch)
+            if not content:
+                return None
+            return self._build_item(owner, repo, branch, file_info, content)
+
+        max_workers = min(32, len(candidates))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(fetch_and_build, file_info) for file_info in candidates]
+            for future in as_completed(futures):
+                item = future.result()
+                if item is not None:
+                    yield item
+
     def should_skip_item(self, item: CrawledItem) -> bool:
         """Check if an item should be skipped based on configuration"""
-        # Check skip patterns
-        skip_patterns = self.config.get("skip_patterns", [])
-        for pattern in skip_patterns:
-            # Convert shell wildcard patterns to regex patterns
-            regex_pattern = self._convert_wildcard_to_regex(pattern)
-            try:
-                if re.search(regex_pattern, item.title, re.IGNORECASE):
-                    return True
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern '{pattern}': {e}")
-                continue
-        
+        # Check skip patterns via the matchers precompiled in __init__
+        literals, skip_re = self._current_skip_matchers()
+        if _skip_match(literals, skip_re, item.title):
+            return True
+
         # Check file size
         max_size = self.config.get("max_file_size", 1024 * 1024)
         if hasattr(item, 'metadata') and item.metadata.get("size", 0) > max_size:
@@ -342,7 +615,7 @@ class GitHubCrawler(CrawlerInterface):
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """Get GitHub API rate limit information"""
         try:
-            response = requests.get(f"{self.base_url}/rate_limit", headers=self.headers)
+            response = self.session.get(f"{self.base_url}/rate_limit")
             response.raise_for_status()
             
             rate_limit = response.json()
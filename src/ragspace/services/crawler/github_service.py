@@ -4,22 +4,65 @@ Handles GitHub repository content fetching and parsing
 """
 
 import os
-import base64
-import requests
 import json
+import time
+import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Optional, Tuple
-from urllib.parse import urlparse
 import logging
 
+from ._gh_url import parse_repo_url
+
 logger = logging.getLogger(__name__)
 
+# orjson parses large payloads (GraphQL batches, recursive tree listings)
+# several times faster than stdlib json; fall back silently when the
+# optional dependency is absent
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
 class GitHubService:
     """Service for interacting with GitHub API"""
     
     def __init__(self):
-        """Initialize GitHub service with token from environment"""
+        """Initialize GitHub service with token(s) from environment"""
         self.token = os.getenv("GITHUB_TOKEN")
+
+        # Optional token pool: GITHUB_TOKENS (comma-separated) is rotated
+        # round-robin per request, multiplying the effective rate limit by
+        # the number of tokens
+        tokens_env = os.getenv("GITHUB_TOKENS")
+        if tokens_env:
+            self.tokens = deque(t.strip() for t in tokens_env.split(",") if t.strip())
+            if not self.token and self.tokens:
+                self.token = self.tokens[0]
+        else:
+            self.tokens = deque([self.token]) if self.token else deque()
+        # token -> unix timestamp when its quota resets (set on exhaustion)
+        self._token_reset = {}
+
+        # Content-addressed blob cache: a blob SHA never changes, so text
+        # cached under it stays valid forever and unchanged files cost no
+        # request at all on re-crawls
+        self.cache_dir = os.path.expanduser(
+            os.getenv("RAGSPACE_GITHUB_CACHE", "~/.cache/ragspace/github")
+        )
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Blob cache disabled ({e})")
+            self.cache_dir = None
         self.base_url = "https://api.github.com"
+        self.graphql_url = "https://api.github.com/graphql"
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "RAGSpace/1.0"
@@ -30,28 +73,109 @@ class GitHubService:
             logger.info("✅ GitHub service initialized with token")
         else:
             logger.warning("⚠️ GitHub service initialized without token (limited rate)")
-    
+
+        # All requests go to one host; a pooled session reuses sockets and
+        # TLS sessions across calls and retries transient failures with
+        # backoff (429/5xx, honoring Retry-After)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+    def _request(self, method: str, url: str, max_attempts: int = 5, **kwargs) -> requests.Response:
+        """Issue an API request, pausing and retrying when rate-limited
+
+        A 403/429 mid-crawl used to abort the whole repo. Instead, wait
+        for the window GitHub advertises (Retry-After, or the
+        X-RateLimit-Reset timestamp when the quota is exhausted), with
+        capped exponential backoff when neither header is present.
+        """
+        kwargs.setdefault("timeout", (5, 30))
+
+        response = None
+        for attempt in range(max_attempts):
+            token = self._next_token()
+            if token:
+                kwargs.setdefault("headers", {})["Authorization"] = f"Bearer {token}"
+
+            response = self.session.request(method, url, **kwargs)
+
+            # Remember when an exhausted token becomes usable again so the
+            # rotation skips it until then
+            if token and response.headers.get("X-RateLimit-Remaining") == "0":
+                reset = response.headers.get("X-RateLimit-Reset")
+                if reset and reset.isdigit():
+                    self._token_reset[token] = int(reset)
+
+            if response.status_code not in (403, 429):
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            reset = response.headers.get("X-RateLimit-Reset")
+            if retry_after and retry_after.isdigit():
+                wait = int(retry_after)
+            elif response.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+                wait = max(0, int(reset) - int(time.time())) + 1
+            else:
+                wait = min(60, 2 ** attempt)
+
+            if attempt < max_attempts - 1:
+                logger.warning(f"Rate limited ({response.status_code}), retrying in {wait}s")
+                time.sleep(wait)
+
+        return response
+
+    def _cached_blob(self, sha: str) -> Optional[str]:
+        """Read a blob's text from the on-disk cache, if present"""
+        if not self.cache_dir or not sha:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, sha), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store_blob(self, sha: str, text: str) -> None:
+        """Store a blob's text in the on-disk cache"""
+        if not self.cache_dir or not sha:
+            return
+        try:
+            with open(os.path.join(self.cache_dir, sha), "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            logger.warning(f"Failed to cache blob {sha}: {e}")
+
+    def _next_token(self) -> Optional[str]:
+        """Rotate to the next token with quota remaining"""
+        if len(self.tokens) <= 1:
+            return self.token
+
+        now = time.time()
+        for _ in range(len(self.tokens)):
+            self.tokens.rotate(-1)
+            token = self.tokens[0]
+            if self._token_reset.get(token, 0) <= now:
+                return token
+        # Every token is exhausted; hand back the current one and let the
+        # rate-limit handling in _request wait out the reset
+        return self.tokens[0]
+
     def parse_repo_url(self, repo_url: str) -> Tuple[str, str]:
         """Parse GitHub repository URL to extract owner and repo name"""
-        try:
-            # Handle different URL formats
-            if repo_url.startswith("https://github.com/"):
-                path = repo_url.replace("https://github.com/", "").rstrip("/")
-            elif repo_url.startswith("github.com/"):
-                path = repo_url.replace("github.com/", "").rstrip("/")
-            else:
-                path = repo_url.rstrip("/")
-            
-            # Split into owner and repo
-            parts = path.split("/")
-            if len(parts) != 2:
-                raise ValueError(f"Invalid GitHub repository URL: {repo_url}")
-            
-            owner, repo = parts
-            return owner, repo
-            
-        except Exception as e:
-            raise ValueError(f"Failed to parse GitHub URL '{repo_url}': {str(e)}")
+        return parse_repo_url(repo_url)
     
     def get_repo_contents(self, owner: str, repo: str, path: str = "", branch: str = "main") -> List[Dict]:
         """Get repository contents at specified path"""
@@ -59,10 +183,10 @@ class GitHubService:
         params = {"ref": branch}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._request("GET", url, params=params)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             if isinstance(data, dict):
                 # Single file
                 return [data]
@@ -74,36 +198,127 @@ class GitHubService:
             logger.error(f"Failed to fetch GitHub contents: {e}")
             raise Exception(f"GitHub API error: {str(e)}")
     
-    def get_file_content(self, owner: str, repo: str, path: str, branch: str = "main") -> str:
-        """Get file content from GitHub repository"""
-        url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
-        params = {"ref": branch}
-        
+    def get_file_content(self, owner: str, repo: str, path: str, branch: str = "main",
+                         sha: Optional[str] = None, max_bytes: int = 1024 * 1024) -> str:
+        """Get file content from GitHub repository
+
+        Requests the raw media type, so the API returns the file bytes
+        directly instead of a JSON envelope with base64 content (~25%
+        fewer bytes on the wire and no decode step). When the blob SHA is
+        known from the tree listing, the git blobs endpoint is used —
+        content-addressed, so GitHub skips the path-to-blob resolution and
+        can serve it from cache. The body is streamed with a hard cap so a
+        file whose listed size was stale cannot blow up memory.
+        """
+        if sha:
+            url = f"{self.base_url}/repos/{owner}/{repo}/git/blobs/{sha}"
+            params = None
+        else:
+            url = f"{self.base_url}/repos/{owner}/{repo}/contents/{path}"
+            params = {"ref": branch}
+
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._request(
+                "GET", url, params=params, stream=True,
+                headers={"Accept": "application/vnd.github.v3.raw"}
+            )
             response.raise_for_status()
-            
-            data = response.json()
-            if data.get("type") != "file":
-                raise ValueError(f"Path {path} is not a file")
-            
-            # Decode base64 content
-            content = base64.b64decode(data["content"]).decode("utf-8")
-            return content
-            
+
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                # Sniff binaries that slip past the extension filter: a NUL
+                # byte in the first chunk means this is not text
+                if not buf and b"\x00" in chunk:
+                    response.close()
+                    raise ValueError(f"File {path} is binary")
+                buf += chunk
+                if len(buf) > max_bytes:
+                    response.close()
+                    raise ValueError(f"File {path} exceeds {max_bytes} bytes")
+            return buf.decode("utf-8", errors="replace")
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch file content: {e}")
             raise Exception(f"GitHub API error: {str(e)}")
     
-    def get_repo_files(self, owner: str, repo: str, branch: str = "main", 
-                      file_types: Optional[List[str]] = None, 
+    def get_repo_tree(self, owner: str, repo: str, branch: str = "main") -> Optional[Dict]:
+        """Get the full repository tree in one API call
+
+        Resolves the branch to its tree SHA, then fetches
+        `GET /git/trees/{sha}?recursive=1` — the whole listing in a single
+        request instead of one per directory.
+        """
+        try:
+            response = self._request("GET", f"{self.base_url}/repos/{owner}/{repo}/branches/{branch}")
+            response.raise_for_status()
+            tree_sha = _json_loads(response.content)["commit"]["commit"]["tree"]["sha"]
+
+            response = self._request(
+                "GET",
+                f"{self.base_url}/repos/{owner}/{repo}/git/trees/{tree_sha}",
+                params={"recursive": "1"}
+            )
+            response.raise_for_status()
+            return _json_loads(response.content)
+
+        except (requests.exceptions.RequestException, KeyError) as e:
+            logger.error(f"Failed to fetch repo tree: {e}")
+            return None
+
+    def get_repo_files(self, owner: str, repo: str, branch: str = "main",
+                      file_types: Optional[List[str]] = None,
                       max_size: int = 50000) -> List[Dict]:
-        """Recursively get all files from repository"""
+        """Get all matching files from repository via the tree listing"""
         if file_types is None:
             file_types = [".md", ".py", ".js", ".ts", ".txt", ".rst", ".adoc"]
-        
+
+        tree = self.get_repo_tree(owner, repo, branch)
+
+        if tree is None or tree.get("truncated"):
+            # Tree unavailable or too large for one response; fall back to
+            # the per-directory contents walk
+            if tree is not None:
+                logger.warning(f"Repo tree for {owner}/{repo} truncated, falling back to directory traversal")
+            return self._get_repo_files_via_contents(owner, repo, branch, file_types, max_size)
+
+        # str.endswith accepts a tuple and runs the whole check in C,
+        # instead of a per-item generator over the extension list
+        ext_tuple = tuple(file_types)
+
         files = []
-        
+        for entry in tree.get("tree", []):
+            if entry.get("type") != "blob":
+                continue
+
+            path = entry["path"]
+            file_name = path.rsplit("/", 1)[-1]
+            file_size = entry.get("size", 0)
+
+            # Skip if file is too large
+            if file_size > max_size:
+                logger.warning(f"Skipping large file: {file_name} ({file_size} bytes)")
+                continue
+
+            # Check if file type is in our target types
+            if file_name.endswith(ext_tuple):
+                files.append({
+                    "name": file_name,
+                    "path": path,
+                    "type": "file",
+                    "size": file_size,
+                    "sha": entry.get("sha", ""),
+                    "html_url": f"https://github.com/{owner}/{repo}/blob/{branch}/{path}"
+                })
+
+        return files
+
+    def _get_repo_files_via_contents(self, owner: str, repo: str, branch: str = "main",
+                                     file_types: Optional[List[str]] = None,
+                                     max_size: int = 50000) -> List[Dict]:
+        """Recursively get all files from repository via the contents API"""
+        files = []
+        ext_tuple = tuple(file_types or ())
+
         def traverse_directory(path: str = ""):
             """Recursively traverse directory structure"""
             try:
@@ -124,7 +339,7 @@ class GitHubService:
                             continue
                         
                         # Check if file type is in our target types
-                        if any(file_name.endswith(ext) for ext in file_types):
+                        if file_name.endswith(ext_tuple):
                             files.append(item)
                             
             except Exception as e:
@@ -134,6 +349,46 @@ class GitHubService:
         traverse_directory()
         return files
     
+    def fetch_file_contents_graphql(self, owner: str, repo: str, branch: str,
+                                    paths: List[str], chunk_size: int = 50) -> Dict[str, str]:
+        """Fetch many file contents per HTTP request via GraphQL blob aliases
+
+        Each POST resolves up to chunk_size blobs, replacing one REST call
+        per file with one call per chunk. Binary blobs and paths the query
+        could not resolve are simply absent from the result, so callers can
+        fall back to REST for them. Requires a token (GraphQL rejects
+        anonymous requests); returns {} without one.
+        """
+        if not self.token:
+            return {}
+
+        contents = {}
+        for start in range(0, len(paths), chunk_size):
+            chunk = paths[start:start + chunk_size]
+            fields = []
+            for i, path in enumerate(chunk):
+                expression = json.dumps(f"{branch}:{path}")
+                fields.append(f'f{i}: object(expression: {expression}) {{ ... on Blob {{ text isBinary }} }}')
+            query = (
+                f'query {{ repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) '
+                f'{{ {" ".join(fields)} }} }}'
+            )
+
+            try:
+                response = self._request("POST", self.graphql_url, json={"query": query}, timeout=(5, 60))
+                response.raise_for_status()
+                repository = (_json_loads(response.content).get("data") or {}).get("repository") or {}
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.error(f"GraphQL content fetch failed for {owner}/{repo}: {e}")
+                continue
+
+            for i, path in enumerate(chunk):
+                blob = repository.get(f"f{i}")
+                if blob and not blob.get("isBinary") and blob.get("text") is not None:
+                    contents[path] = blob["text"]
+
+        return contents
+
     def fetch_repo_structure(self, repo_url: str, branch: str = "main") -> Dict:
         """Fetch complete repository structure and content"""
         owner, repo = self.parse_repo_url(repo_url)
@@ -159,32 +414,70 @@ class GitHubService:
             "children": []
         }
         
-        # Fetch content for each file
+        # Serve unchanged blobs from the on-disk cache first — their SHAs
+        # come straight from the tree listing
+        contents = {}
+        sha_by_path = {}
         for file_info in files:
-            try:
-                file_path = file_info["path"]
-                file_content = self.get_file_content(owner, repo, file_path, branch)
-                
-                child_doc = {
-                    "type": "github_file",
-                    "name": file_path,
-                    "url": file_info["html_url"],
-                    "content": file_content,
-                    "metadata": {
-                        "repo": f"{owner}/{repo}",
-                        "branch": branch,
-                        "path": file_path,
-                        "size": file_info.get("size", 0),
-                        "sha": file_info.get("sha", "")
-                    }
-                }
-                
-                repo_doc["children"].append(child_doc)
-                logger.info(f"Fetched file: {file_path}")
-                
-            except Exception as e:
-                logger.error(f"Failed to fetch file {file_info['path']}: {e}")
+            sha_by_path[file_info["path"]] = file_info.get("sha", "")
+            cached = self._cached_blob(file_info.get("sha", ""))
+            if cached is not None:
+                contents[file_info["path"]] = cached
+
+        # Batch-fetch the rest over GraphQL, then fill any gaps (binary
+        # blobs, oversized responses, anonymous access) via REST
+        fetched = self.fetch_file_contents_graphql(
+            owner, repo, branch,
+            [file_info["path"] for file_info in files if file_info["path"] not in contents]
+        )
+        for file_path, text in fetched.items():
+            self._store_blob(sha_by_path.get(file_path, ""), text)
+        contents.update(fetched)
+
+        # Fetch the remaining files concurrently: each REST call is an
+        # independent round trip, and the bounded pool keeps us well under
+        # GitHub's secondary abuse limits
+        missing = [file_info for file_info in files if file_info["path"] not in contents]
+        if missing:
+            def fetch(file_info):
+                try:
+                    return file_info["path"], self.get_file_content(
+                        owner, repo, file_info["path"], branch,
+                        sha=file_info.get("sha") or None
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to fetch file {file_info['path']}: {e}")
+                    return file_info["path"], None
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                for file_path, file_content in pool.map(fetch, missing):
+                    if file_content is not None:
+                        contents[file_path] = file_content
+                        self._store_blob(sha_by_path.get(file_path, ""), file_content)
+
+        # Assemble children in listing order
+        for file_info in files:
+            file_path = file_info["path"]
+            file_content = contents.get(file_path)
+            if file_content is None:
                 continue
+
+            child_doc = {
+                "type": "github_file",
+                "name": file_path,
+                "url": file_info["html_url"],
+                "content": file_content,
+                "metadata": {
+                    "repo": f"{owner}/{repo}",
+                    "branch": branch,
+                    "path": file_path,
+                    "size": file_info.get("size", 0),
+                    "sha": file_info.get("sha", "")
+                }
+            }
+
+            repo_doc["children"].append(child_doc)
+            logger.info(f"Fetched file: {file_path}")
         
         logger.info(f"✅ Successfully fetched {len(repo_doc['children'])} files from {owner}/{repo}")
         return repo_doc
@@ -192,9 +485,9 @@ class GitHubService:
     def get_rate_limit_info(self) -> Dict:
         """Get current rate limit information"""
         try:
-            response = requests.get(f"{self.base_url}/rate_limit", headers=self.headers)
+            response = self._request("GET", f"{self.base_url}/rate_limit")
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Failed to get rate limit info: {e}")
             return {"error": str(e)} 
\ No newline at end of file
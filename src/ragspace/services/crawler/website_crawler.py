@@ -2,8 +2,6 @@
 Website crawler implementation
 """
 
-import os
-import re
 import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional, Any
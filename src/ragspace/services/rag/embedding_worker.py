@@ -4,9 +4,14 @@ Embedding worker for processing document embeddings
 
 import os
 import asyncio
+import hashlib
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import openai
 from dotenv import load_dotenv
 
@@ -20,6 +25,39 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Request-size limits for the embeddings endpoint. Token counts are
+# approximated at ~4 characters per token, which is conservative enough
+# to stay under the API's 300k-token request cap without a tokenizer
+# dependency.
+_EMBED_BATCH_MAX_ITEMS = 2048
+_EMBED_BATCH_MAX_TOKENS = 300_000
+
+# Embeddings kept in the per-worker digest cache (~12KB per vector)
+_EMBED_CACHE_MAX_ENTRIES = 2048
+
+# Chunk rows per upsert request; keeps payloads under PostgREST limits
+_UPSERT_BATCH_SIZE = 64
+
+# Columns the worker actually reads from documents rows; selecting them
+# explicitly keeps PostgREST responses small
+_DOC_COLUMNS = "id,name,docset_id,type,url,added_date,metadata,content"
+
+
+def _utc_now_iso() -> str:
+    """Timezone-aware UTC timestamp, built once per update batch"""
+    return datetime.now(timezone.utc).isoformat()
+
+
+# doc_type -> source_type, replacing the if/elif chain with one lookup
+_SOURCE_TYPE_MAP = {
+    'file': 'file',
+    'github_file': 'github',
+    'github_readme': 'github',
+    'github_repo': 'github',
+    'website': 'website',
+    'url': 'website',
+}
+
 
 class EmbeddingWorker:
     """Async worker for processing document embeddings"""
@@ -35,11 +73,22 @@ class EmbeddingWorker:
         if not api_key:
             raise ValueError("OPENAI_API_KEY must be set in environment variables")
         
-        self.openai_client = openai.OpenAI(api_key=api_key)
+        # Async client: embedding calls await HTTP I/O directly instead of
+        # blocking the event loop, so batch_process concurrency can overlap
+        self.openai_client = openai.AsyncOpenAI(api_key=api_key)
         
         # Embedding model configuration
         self.embedding_model = "text-embedding-3-small"
         self.embedding_dimensions = 1536
+
+        # docset_id -> name, so batches from the same docset don't repeat
+        # the translation SELECT per document
+        self._docset_name_cache: Dict[str, str] = {}
+
+        # text digest -> float32 vector, LRU-bounded; repeated boilerplate
+        # (license blocks, shared README fragments) is embedded once per
+        # worker lifetime instead of once per occurrence
+        self._embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
         
         logger.info(f"✅ Embedding worker initialized with model: {self.embedding_model}")
     
@@ -56,41 +105,63 @@ class EmbeddingWorker:
         try:
             # Update status to processing
             self._update_document_status(doc_id, "processing")
-            
+
             # Get document from database
             document = self._get_document(doc_id)
             if not document:
                 raise ValueError(f"Document {doc_id} not found")
-            
-            # Split document into chunks
-            chunks = self.text_splitter.split_document(document)
+
+            result = await self._process_document_row(document)
+
+            # Update document status
+            self._update_document_status(doc_id, "done" if result["status"] == "success" else "error")
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ Error processing document {doc_id}: {e}")
+            self._update_document_status(doc_id, "error")
+            return {"status": "error", "message": str(e)}
+
+    async def _process_document_row(self, document: Dict) -> Dict[str, Any]:
+        """
+        Split, embed and store an already-fetched document row
+
+        Status updates are left to the caller so batch_process can issue
+        them in bulk.
+
+        Args:
+            document: Document row from the database
+
+        Returns:
+            Processing result dictionary
+        """
+        doc_id = document['id']
+        try:
+            # Split document into chunks off the event loop so in-flight
+            # embedding requests keep draining during the CPU-bound split
+            chunks = await asyncio.to_thread(self.text_splitter.split_document, document)
             if not chunks:
                 logger.warning(f"No chunks generated for document {doc_id}")
-                self._update_document_status(doc_id, "error")
-                return {"status": "error", "message": "No chunks generated"}
-            
+                return {"status": "error", "document_id": doc_id, "message": "No chunks generated"}
+
             # Generate embeddings for chunks
             embeddings = await self._generate_embeddings([chunk['content'] for chunk in chunks])
-            
+
             # Store chunks with embeddings
             stored_chunks = self._store_chunks(document, chunks, embeddings)
-            
-            # Update document status
-            self._update_document_status(doc_id, "done")
-            
+
             logger.info(f"✅ Successfully processed document {doc_id}: {len(stored_chunks)} chunks")
-            
+
             return {
                 "status": "success",
                 "document_id": doc_id,
                 "chunks_processed": len(stored_chunks),
                 "embedding_model": self.embedding_model
             }
-            
+
         except Exception as e:
             logger.error(f"❌ Error processing document {doc_id}: {e}")
-            self._update_document_status(doc_id, "error")
-            return {"status": "error", "message": str(e)}
+            return {"status": "error", "document_id": doc_id, "message": str(e)}
     
     async def batch_process(self, docset_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -110,20 +181,31 @@ class EmbeddingWorker:
                 return {"status": "success", "message": "No pending documents to process"}
             
             logger.info(f"🔄 Starting batch processing of {len(pending_docs)} documents")
-            
-            # Process documents concurrently (with rate limiting)
-            semaphore = asyncio.Semaphore(3)  # Limit concurrent requests
-            
-            async def process_with_semaphore(doc):
-                async with semaphore:
-                    return await self.process_document(doc['id'])
-            
-            # Process documents
-            tasks = [process_with_semaphore(doc) for doc in pending_docs]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
+
+            # Mark the whole batch as processing with one UPDATE instead of
+            # one round-trip per document
+            doc_ids = [doc['id'] for doc in pending_docs]
+            self._bulk_update_status(doc_ids, "processing")
+
+            # Three-stage pipeline over bounded queues: splitting is
+            # CPU-bound Python, embedding and storage are network-bound, so
+            # overlapping them keeps throughput at the slowest stage instead
+            # of the sum of all three
+            results = await self._run_pipeline(pending_docs)
+
+            # Partition ids and issue one final UPDATE per outcome
+            done_ids = [
+                doc['id'] for doc, result in zip(pending_docs, results)
+                if isinstance(result, dict) and result.get('status') == 'success'
+            ]
+            done_id_set = set(done_ids)
+            error_ids = [doc_id for doc_id in doc_ids if doc_id not in done_id_set]
+            finished_at = _utc_now_iso()
+            self._bulk_update_status(done_ids, "done", finished_at)
+            self._bulk_update_status(error_ids, "error", finished_at)
+
             # Count results
-            successful = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'success')
+            successful = len(done_ids)
             failed = len(results) - successful
             
             logger.info(f"✅ Batch processing completed: {successful} successful, {failed} failed")
@@ -139,8 +221,99 @@ class EmbeddingWorker:
         except Exception as e:
             logger.error(f"❌ Error in batch processing: {e}")
             return {"status": "error", "message": str(e)}
-    
-    async def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+
+    async def _run_pipeline(self, pending_docs: List[Dict]) -> List[Dict]:
+        """
+        Run the split -> embed -> store pipeline over the given documents
+
+        Stages communicate through bounded queues so a slow stage back-
+        pressures the ones before it instead of buffering the whole batch.
+
+        Args:
+            pending_docs: Document rows to process
+
+        Returns:
+            Per-document result dicts in the same order as pending_docs
+        """
+        doc_q: asyncio.Queue = asyncio.Queue()
+        embed_q: asyncio.Queue = asyncio.Queue(maxsize=8)
+        write_q: asyncio.Queue = asyncio.Queue(maxsize=8)
+        results: Dict[Any, Dict] = {}
+
+        async def split_worker():
+            while True:
+                doc = await doc_q.get()
+                try:
+                    chunks = await asyncio.to_thread(self.text_splitter.split_document, doc)
+                    if chunks:
+                        await embed_q.put((doc, chunks))
+                    else:
+                        logger.warning(f"No chunks generated for document {doc['id']}")
+                        results[doc['id']] = {
+                            "status": "error", "document_id": doc['id'],
+                            "message": "No chunks generated"
+                        }
+                except Exception as e:
+                    logger.error(f"❌ Error splitting document {doc['id']}: {e}")
+                    results[doc['id']] = {"status": "error", "document_id": doc['id'], "message": str(e)}
+                finally:
+                    doc_q.task_done()
+
+        async def embed_worker():
+            while True:
+                doc, chunks = await embed_q.get()
+                try:
+                    embeddings = await self._generate_embeddings(
+                        [chunk['content'] for chunk in chunks]
+                    )
+                    await write_q.put((doc, chunks, embeddings))
+                except Exception as e:
+                    logger.error(f"❌ Error embedding document {doc['id']}: {e}")
+                    results[doc['id']] = {"status": "error", "document_id": doc['id'], "message": str(e)}
+                finally:
+                    embed_q.task_done()
+
+        async def write_worker():
+            while True:
+                doc, chunks, embeddings = await write_q.get()
+                try:
+                    stored_chunks = await asyncio.to_thread(self._store_chunks, doc, chunks, embeddings)
+                    logger.info(f"✅ Successfully processed document {doc['id']}: {len(stored_chunks)} chunks")
+                    results[doc['id']] = {
+                        "status": "success",
+                        "document_id": doc['id'],
+                        "chunks_processed": len(stored_chunks),
+                        "embedding_model": self.embedding_model
+                    }
+                except Exception as e:
+                    logger.error(f"❌ Error storing chunks for document {doc['id']}: {e}")
+                    results[doc['id']] = {"status": "error", "document_id": doc['id'], "message": str(e)}
+                finally:
+                    write_q.task_done()
+
+        # 2 splitters (CPU), 3 embedders (the previous semaphore bound),
+        # 2 writers (Supabase upserts)
+        workers = (
+            [asyncio.create_task(split_worker()) for _ in range(2)] +
+            [asyncio.create_task(embed_worker()) for _ in range(3)] +
+            [asyncio.create_task(write_worker()) for _ in range(2)]
+        )
+
+        try:
+            for doc in pending_docs:
+                doc_q.put_nowait(doc)
+            # Drain stage by stage: each join waits until every item put
+            # upstream has been handed to the next queue
+            await doc_q.join()
+            await embed_q.join()
+            await write_q.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        return [results[doc['id']] for doc in pending_docs]
+
+    async def _generate_embeddings(self, texts: List[str]) -> List[np.ndarray]:
         """
         Generate embeddings for a list of texts
         
@@ -151,25 +324,98 @@ class EmbeddingWorker:
             List of embedding vectors
         """
         try:
-            # Batch process embeddings
-            response = self.openai_client.embeddings.create(
-                model=self.embedding_model,
-                input=texts
+            # Dedupe by text digest: identical chunks (boilerplate headers,
+            # license blocks) are embedded once, and digests seen in earlier
+            # documents are served from the cache without an API call
+            keys = [
+                hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+                for text in texts
+            ]
+            emb_by_key: Dict[bytes, np.ndarray] = {}
+            pending: "OrderedDict[bytes, str]" = OrderedDict()
+            for key, text in zip(keys, texts):
+                if key in emb_by_key or key in pending:
+                    continue
+                cached = self._embedding_cache.get(key)
+                if cached is not None:
+                    self._embedding_cache.move_to_end(key)
+                    emb_by_key[key] = cached
+                else:
+                    pending[key] = text
+
+            if pending:
+                # Split into request-sized batches and embed them concurrently
+                batches = self._batch_texts(list(pending.values()))
+
+                async def embed_batch(batch: List[str]) -> List[np.ndarray]:
+                    response = await self.openai_client.embeddings.create(
+                        model=self.embedding_model,
+                        input=batch
+                    )
+                    # float32 halves in-memory size with no retrieval-quality
+                    # impact; vectors stay ndarrays until serialized at the
+                    # storage edge
+                    return [
+                        np.asarray(embedding.embedding, dtype=np.float32)
+                        for embedding in response.data
+                    ]
+
+                # gather preserves batch order, so the flattened list lines
+                # up with the pending keys
+                results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+                fetched = [embedding for batch_embeddings in results for embedding in batch_embeddings]
+                for key, embedding in zip(pending, fetched):
+                    emb_by_key[key] = embedding
+                    self._embedding_cache[key] = embedding
+                    if len(self._embedding_cache) > _EMBED_CACHE_MAX_ENTRIES:
+                        self._embedding_cache.popitem(last=False)
+
+            # Scatter back so output order matches the input texts
+            embeddings = [emb_by_key[key] for key in keys]
+
+            logger.info(
+                f"✅ Generated {len(embeddings)} embeddings "
+                f"({len(pending)} fetched, {len(embeddings) - len(pending)} deduplicated/cached)"
             )
-            
-            embeddings = [embedding.embedding for embedding in response.data]
-            
-            logger.info(f"✅ Generated {len(embeddings)} embeddings")
             return embeddings
-            
+
         except Exception as e:
             logger.error(f"❌ Error generating embeddings: {e}")
             raise
+
+    def _batch_texts(self, texts: List[str]) -> List[List[str]]:
+        """
+        Split texts into batches that fit the embeddings request limits
+
+        Args:
+            texts: List of texts to batch
+
+        Returns:
+            List of batches, preserving input order
+        """
+        batches = []
+        batch: List[str] = []
+        batch_tokens = 0
+
+        for text in texts:
+            tokens = max(1, len(text) // 4)
+            if batch and (len(batch) >= _EMBED_BATCH_MAX_ITEMS or
+                          batch_tokens + tokens > _EMBED_BATCH_MAX_TOKENS):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
     
     def _get_document(self, doc_id: str) -> Optional[Dict]:
         """Get document from database"""
         try:
-            result = self.storage.supabase.table("documents").select("*").eq("id", doc_id).execute()
+            result = self.storage.supabase.table("documents").select(_DOC_COLUMNS).eq("id", doc_id).execute()
             return result.data[0] if result.data else None
         except Exception as e:
             logger.error(f"❌ Error getting document {doc_id}: {e}")
@@ -178,7 +424,7 @@ class EmbeddingWorker:
     def _get_pending_documents(self, docset_name: Optional[str] = None) -> List[Dict]:
         """Get pending documents for processing"""
         try:
-            query = self.storage.supabase.table("documents").select("*").eq("embedding_status", "pending")
+            query = self.storage.supabase.table("documents").select(_DOC_COLUMNS).eq("embedding_status", "pending")
             
             if docset_name:
                 # Get docset ID
@@ -194,12 +440,31 @@ class EmbeddingWorker:
             logger.error(f"❌ Error getting pending documents: {e}")
             return []
     
+    def _bulk_update_status(self, doc_ids: List[str], status: str, timestamp: Optional[str] = None):
+        """Update embedding status for a batch of documents in one UPDATE
+
+        An explicit timestamp lets related updates in one batch share the
+        same embedding_updated_at value.
+        """
+        if not doc_ids:
+            return
+        try:
+            self.storage.supabase.table("documents").update({
+                "embedding_status": status,
+                "embedding_updated_at": timestamp or _utc_now_iso()
+            }).in_("id", doc_ids).execute()
+
+            logger.info(f"✅ Updated {len(doc_ids)} documents to status: {status}")
+
+        except Exception as e:
+            logger.error(f"❌ Error bulk updating document status: {e}")
+
     def _update_document_status(self, doc_id: str, status: str):
         """Update document embedding status"""
         try:
             self.storage.supabase.table("documents").update({
                 "embedding_status": status,
-                "embedding_updated_at": datetime.now().isoformat()
+                "embedding_updated_at": _utc_now_iso()
             }).eq("id", doc_id).execute()
             
             logger.info(f"✅ Updated document {doc_id} status to: {status}")
@@ -207,7 +472,7 @@ class EmbeddingWorker:
         except Exception as e:
             logger.error(f"❌ Error updating document status: {e}")
     
-    def _store_chunks(self, document: Dict, chunks: List[Dict], embeddings: List[List[float]]) -> List[Dict]:
+    def _store_chunks(self, document: Dict, chunks: List[Dict], embeddings: List[np.ndarray]) -> List[Dict]:
         """
         Store chunks with embeddings in database
         
@@ -220,22 +485,31 @@ class EmbeddingWorker:
             List of stored chunk data
         """
         try:
-            # Get docset name from the document's docset_id
+            # Get docset name from the document's docset_id, memoized so a
+            # batch from one docset costs a single lookup
             docset_name = 'default'
-            if document.get('docset_id'):
-                try:
-                    docset_result = self.storage.supabase.table("docsets").select("name").eq("id", document['docset_id']).execute()
-                    if docset_result.data:
-                        docset_name = docset_result.data[0]['name']
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not get docset name for docset_id {document['docset_id']}: {e}")
-            
-            # Prepare chunks for storage
+            docset_id = document.get('docset_id')
+            if docset_id:
+                docset_name = self._docset_name_cache.get(docset_id)
+                if docset_name is None:
+                    docset_name = 'default'
+                    try:
+                        docset_result = self.storage.supabase.table("docsets").select("name").eq("id", docset_id).execute()
+                        if docset_result.data:
+                            docset_name = docset_result.data[0]['name']
+                        self._docset_name_cache[docset_id] = docset_name
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not get docset name for docset_id {docset_id}: {e}")
+            
+            # Prepare chunks for storage; everything document-invariant is
+            # computed once here rather than per chunk
+            source_type = self._determine_source_type(document)
+            common_metadata = self._document_common_metadata(document, source_type)
             chunks_data = []
-            
+
             for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
                 # Enhanced metadata with source information
-                enhanced_metadata = self._enhance_chunk_metadata(chunk, document, i)
+                enhanced_metadata = self._enhance_chunk_metadata(chunk, common_metadata, i)
                 
                 chunk_data = {
                     "docset_name": docset_name,
@@ -243,94 +517,116 @@ class EmbeddingWorker:
                     "document_id": document['id'],
                     "chunk_index": i,
                     "content": chunk['content'],
-                    "embedding": embedding,
+                    # Serialize to a plain list only here, at the JSON edge
+                    "embedding": embedding.tolist(),
                     "metadata": enhanced_metadata
                 }
                 chunks_data.append(chunk_data)
             
             # Log chunk data for debugging
-            chunk_indices = [chunk['chunk_index'] for chunk in chunks_data]
-            logger.info(f"📝 Preparing to insert {len(chunks_data)} chunks with indices: {chunk_indices}")
-            
-            # Use UPSERT operation to handle duplicates gracefully
-            # This will update existing chunks or insert new ones
-            result = self.storage.supabase.table("chunks").upsert(
-                chunks_data,
-                on_conflict="document_id,chunk_index"
-            ).execute()
-            
-            logger.info(f"✅ Stored {len(result.data)} chunks for document {document['id']}")
-            
-            return result.data
+            logger.info(f"📝 Preparing to insert {len(chunks_data)} chunks for document {document['id']}")
+
+            # Use UPSERT operation to handle duplicates gracefully, in
+            # bounded batches so large documents (hundreds of chunks x 1536
+            # floats) stay under request-size limits. Batches go out in
+            # parallel; chunk_index keeps ordering independent of arrival.
+            def upsert_batch(batch: List[Dict]) -> List[Dict]:
+                result = self.storage.supabase.table("chunks").upsert(
+                    batch,
+                    on_conflict="document_id,chunk_index"
+                ).execute()
+                return result.data
+
+            batches = [
+                chunks_data[i:i + _UPSERT_BATCH_SIZE]
+                for i in range(0, len(chunks_data), _UPSERT_BATCH_SIZE)
+            ]
+            if len(batches) == 1:
+                stored = upsert_batch(batches[0])
+            else:
+                stored = []
+                with ThreadPoolExecutor(max_workers=min(4, len(batches))) as pool:
+                    for batch_data in pool.map(upsert_batch, batches):
+                        stored.extend(batch_data)
+
+            logger.info(f"✅ Stored {len(stored)} chunks for document {document['id']}")
+
+            return stored
             
         except Exception as e:
             logger.error(f"❌ Error storing chunks for document {document.get('id', 'unknown')}: {e}")
             return []
     
-    def _enhance_chunk_metadata(self, chunk: Dict, document: Dict, chunk_index: int) -> Dict:
+    def _document_common_metadata(self, document: Dict, source_type: str) -> Dict:
         """
-        Enhance chunk metadata with source information for document attribution
-        
+        Build the document-invariant metadata shared by every chunk
+
         Args:
-            chunk: Original chunk metadata
             document: Original document
-            chunk_index: Index of the chunk
-            
+            source_type: Source type resolved once per document
+
         Returns:
-            Enhanced metadata dictionary
+            Metadata dictionary merged into each chunk's metadata
         """
-        # Start with original chunk metadata
-        enhanced_metadata = chunk.get('metadata', {}).copy()
-        
-        # Add document-level information
-        enhanced_metadata.update({
+        doc_metadata = document.get('metadata') or {}
+
+        # Document-level information
+        common = {
             "document_id": document.get('id'),
             "document_name": document.get('name', 'Unknown'),
             "docset_name": document.get('docset_name', 'default'),
-            "chunk_index": chunk_index,
-            "source_type": self._determine_source_type(document),
+            "source_type": source_type,
             "url": document.get('url', ''),
             "doc_type": document.get('type', 'file'),
             "timestamp": document.get('added_date', ''),
-        })
-        
-        # Add source-specific information
-        source_type = enhanced_metadata.get('source_type', 'unknown')
-        
+        }
+
+        # Source-specific information
         if source_type == "github":
-            # GitHub-specific metadata
-            enhanced_metadata.update({
-                "repo": document.get('metadata', {}).get('repo', ''),
-                "owner": document.get('metadata', {}).get('owner', ''),
-                "branch": document.get('metadata', {}).get('branch', 'main'),
-                "path": document.get('metadata', {}).get('path', ''),
-                "sha": document.get('metadata', {}).get('sha', ''),
-                "file_path": document.get('metadata', {}).get('path', ''),
+            common.update({
+                "repo": doc_metadata.get('repo', ''),
+                "owner": doc_metadata.get('owner', ''),
+                "branch": doc_metadata.get('branch', 'main'),
+                "path": doc_metadata.get('path', ''),
+                "sha": doc_metadata.get('sha', ''),
+                "file_path": doc_metadata.get('path', ''),
             })
-            
-            # Add line number information if available
-            if 'start_line' in chunk.get('metadata', {}):
-                enhanced_metadata['start_line'] = chunk['metadata']['start_line']
-            if 'end_line' in chunk.get('metadata', {}):
-                enhanced_metadata['end_line'] = chunk['metadata']['end_line']
-        
+
         elif source_type == "website":
-            # Website-specific metadata
-            enhanced_metadata.update({
-                "title": document.get('metadata', {}).get('title', ''),
-                "depth": document.get('metadata', {}).get('depth', 0),
-                "content_size": document.get('metadata', {}).get('content_size', 0),
+            common.update({
+                "title": doc_metadata.get('title', ''),
+                "depth": doc_metadata.get('depth', 0),
+                "content_size": doc_metadata.get('content_size', 0),
             })
-        
+
         elif source_type == "file":
-            # File upload-specific metadata
-            enhanced_metadata.update({
-                "file_size": document.get('metadata', {}).get('size', 0),
-                "file_type": document.get('metadata', {}).get('file_type', ''),
+            common.update({
+                "file_size": doc_metadata.get('size', 0),
+                "file_type": doc_metadata.get('file_type', ''),
                 "upload_date": document.get('added_date', ''),
             })
-        
-        return enhanced_metadata
+
+        return common
+
+    def _enhance_chunk_metadata(self, chunk: Dict, common_metadata: Dict, chunk_index: int) -> Dict:
+        """
+        Enhance chunk metadata with source information for document attribution
+
+        Args:
+            chunk: Original chunk metadata
+            common_metadata: Document-invariant metadata from _document_common_metadata
+            chunk_index: Index of the chunk
+
+        Returns:
+            Enhanced metadata dictionary
+        """
+        # Chunk-specific fields (e.g. start_line/end_line) come from the
+        # chunk's own metadata; the shared document fields are merged on top
+        return {
+            **(chunk.get('metadata') or {}),
+            **common_metadata,
+            "chunk_index": chunk_index,
+        }
     
     def _determine_source_type(self, document: Dict) -> str:
         """
@@ -342,22 +638,11 @@ class EmbeddingWorker:
         Returns:
             Source type string
         """
-        doc_type = document.get('type', 'file')
-        doc_metadata = document.get('metadata', {})
-        
         # Check metadata for GitHub information first
+        doc_metadata = document.get('metadata') or {}
         if doc_metadata.get('repo') and doc_metadata.get('owner'):
             return 'github'
-        elif doc_metadata.get('url') and doc_type in ['website', 'url']:
-            return 'website'
-        elif doc_type == 'file':
-            return 'file'
-        elif doc_type in ['github_file', 'github_readme', 'github_repo']:
-            return 'github'
-        elif doc_type in ['website', 'url']:
-            return 'website'
-        else:
-            return 'unknown'
+        return _SOURCE_TYPE_MAP.get(document.get('type', 'file'), 'unknown')
     
     def get_embedding_status_summary(self, docset_name: Optional[str] = None) -> Dict[str, int]:
         """
@@ -370,25 +655,37 @@ class EmbeddingWorker:
             Dictionary with status counts
         """
         try:
-            query = self.storage.supabase.table("documents").select("embedding_status")
-            
+            docset_id = None
             if docset_name:
                 # Get docset ID
                 docset_result = self.storage.supabase.table("docsets").select("id").eq("name", docset_name).execute()
                 if docset_result.data:
                     docset_id = docset_result.data[0]['id']
-                    query = query.eq("docset_id", docset_id)
-            
+
+            # Aggregate server-side: the RPC returns one row per status
+            # instead of one row per document
+            try:
+                result = self.storage.supabase.rpc(
+                    "embedding_status_counts",
+                    {"filter_docset_id": docset_id}
+                ).execute()
+                return {row['embedding_status']: row['count'] for row in result.data}
+            except Exception as rpc_error:
+                logger.warning(f"⚠️ embedding_status_counts RPC unavailable, counting client-side: {rpc_error}")
+
+            # Fallback: fetch statuses and count in Python
+            query = self.storage.supabase.table("documents").select("embedding_status")
+            if docset_id:
+                query = query.eq("docset_id", docset_id)
             result = query.execute()
-            
-            # Count statuses
+
             status_counts = {}
             for doc in result.data:
                 status = doc.get('embedding_status', 'unknown')
                 status_counts[status] = status_counts.get(status, 0) + 1
-            
+
             return status_counts
-            
+
         except Exception as e:
             logger.error(f"❌ Error getting embedding status summary: {e}")
             return {}
@@ -404,6 +701,9 @@ class EmbeddingWorker:
             Trigger result
         """
         try:
+            # Docset names may have changed since they were cached
+            self._docset_name_cache.clear()
+
             # Get all documents in docset
             docset = self.storage.get_docset_by_name(docset_name)
             if not docset:
@@ -412,7 +712,7 @@ class EmbeddingWorker:
             # Update all documents to pending status
             result = self.storage.supabase.table("documents").update({
                 "embedding_status": "pending",
-                "embedding_updated_at": datetime.now().isoformat()
+                "embedding_updated_at": _utc_now_iso()
             }).eq("docset_id", docset['id']).execute()
             
             logger.info(f"✅ Triggered embedding for {len(result.data)} documents in docset '{docset_name}'")
@@ -3,51 +3,95 @@ Mock RAG Manager for testing
 """
 
 import asyncio
+import os
+import re
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 from unittest.mock import Mock
 
+# All dispatch keywords in one alternation so a query is scanned once
+# instead of once per keyword
+_KEYWORD_RE = re.compile(r"error|test|hello|hi|help")
+
+# keyword -> response key, checked in priority order after the scan
+_KEYWORD_TO_RESPONSE = (
+    ("error", "error"),
+    ("test", "test"),
+    ("hello", "hello"),
+    ("hi", "hello"),
+    ("help", "help"),
+)
+
+
+def _match_response_key(query_lower: str) -> Optional[str]:
+    """Return the response key for the highest-priority keyword in the query"""
+    found = set(_KEYWORD_RE.findall(query_lower))
+    if found:
+        for keyword, response_key in _KEYWORD_TO_RESPONSE:
+            if keyword in found:
+                return response_key
+    return None
+
+
+# Shared immutable response table; instances reference it instead of
+# rebuilding the dict per construction
+_MOCK_RESPONSES = MappingProxyType({
+    "default": "This is a mock RAG response for testing purposes.",
+    "test": "This is a test response from the mock RAG system.",
+    "hello": "Hello! This is a mock response to your greeting.",
+    "help": "I'm a mock RAG system. I can help you with test queries.",
+    "error": "Mock error response for testing error handling."
+})
+
+# Canonical mock sources, built once; query_with_metadata hands out a
+# fresh list wrapper so callers may append without touching the shared data
+_MOCK_SOURCES = (
+    {
+        "document_name": "Mock Document 1",
+        "docset_name": "test_docset",
+        "source_url": "https://github.com/test/repo/blob/main/README.md#L1-L10",
+        "content_preview": "This is a mock document for testing purposes...",
+        "chunk_index": 0,
+        "metadata": {
+            "source_type": "github",
+            "owner": "test",
+            "repo": "repo",
+            "path": "README.md",
+            "start_line": 1,
+            "end_line": 10
+        }
+    },
+)
+
+
 class MockRAGManager:
     """Mock RAG Manager for testing purposes"""
-    
+
     def __init__(self):
-        self.mock_responses = {
-            "default": "This is a mock RAG response for testing purposes.",
-            "test": "This is a test response from the mock RAG system.",
-            "hello": "Hello! This is a mock response to your greeting.",
-            "help": "I'm a mock RAG system. I can help you with test queries.",
-            "error": "Mock error response for testing error handling."
-        }
-    
+        # Artificial async latency, off by default so test suites don't
+        # pay 100ms per mock call; set RAGSPACE_MOCK_LATENCY_S to restore
+        self._simulate_latency_s = float(os.getenv("RAGSPACE_MOCK_LATENCY_S", "0"))
+        self.mock_responses = _MOCK_RESPONSES
+
     async def query_knowledge_base(self, query: str, docset_name: Optional[str] = None):
         """Mock query method that returns predefined responses as async generator"""
-        # Simulate async processing
-        await asyncio.sleep(0.1)
+        # Simulate async processing only when latency is enabled
+        if self._simulate_latency_s:
+            await asyncio.sleep(self._simulate_latency_s)
         
         # Return mock response based on query
-        query_lower = query.lower().strip()
-        
-        if "error" in query_lower:
+        response_key = _match_response_key(query.lower().strip())
+
+        if response_key == "error":
             yield "❌ Mock error: This is a test error response."
             return
-        
-        if "test" in query_lower:
-            yield self.mock_responses["test"]
-            return
-        
-        if "hello" in query_lower or "hi" in query_lower:
-            yield self.mock_responses["hello"]
-            return
-        
-        if "help" in query_lower:
-            yield self.mock_responses["help"]
-            return
-        
-        # Default response
-        yield self.mock_responses["default"]
+
+        yield self.mock_responses[response_key or "default"]
     
     async def process_document_embeddings(self, docset_name: Optional[str] = None) -> str:
         """Mock embedding processing"""
-        await asyncio.sleep(0.1)
+        if self._simulate_latency_s:
+            await asyncio.sleep(self._simulate_latency_s)
         return "✅ Mock embedding processing completed successfully."
     
     def get_embedding_status(self) -> str:
@@ -63,13 +107,14 @@ class MockRAGManager:
     
     async def query_with_metadata(self, query: str, docsets: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock query method with metadata for testing purposes"""
-        # Simulate async processing
-        await asyncio.sleep(0.1)
+        # Simulate async processing only when latency is enabled
+        if self._simulate_latency_s:
+            await asyncio.sleep(self._simulate_latency_s)
         
         # Return mock response based on query
-        query_lower = query.lower().strip()
-        
-        if "error" in query_lower:
+        response_key = _match_response_key(query.lower().strip())
+
+        if response_key == "error":
             return {
                 "status": "error",
                 "query": query,
@@ -79,39 +124,13 @@ class MockRAGManager:
                 "metadata": {}
             }
         
-        # Prepare mock sources
-        mock_sources = [
-            {
-                "document_name": "Mock Document 1",
-                "docset_name": "test_docset",
-                "source_url": "https://github.com/test/repo/blob/main/README.md#L1-L10",
-                "content_preview": "This is a mock document for testing purposes...",
-                "chunk_index": 0,
-                "metadata": {
-                    "source_type": "github",
-                    "owner": "test",
-                    "repo": "repo",
-                    "path": "README.md",
-                    "start_line": 1,
-                    "end_line": 10
-                }
-            }
-        ]
-        
-        if "test" in query_lower:
-            response = self.mock_responses["test"]
-        elif "hello" in query_lower or "hi" in query_lower:
-            response = self.mock_responses["hello"]
-        elif "help" in query_lower:
-            response = self.mock_responses["help"]
-        else:
-            response = self.mock_responses["default"]
-        
+        response = self.mock_responses[response_key or "default"]
+
         return {
             "status": "success",
             "query": query,
             "response": response,
-            "sources": mock_sources,
+            "sources": list(_MOCK_SOURCES),
             "metadata": {
                 "chunks_retrieved": 1,
                 "retrieval_time": 0.1,
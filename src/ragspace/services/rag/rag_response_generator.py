@@ -3,8 +3,12 @@ RAG Response Generator for generating contextual responses
 """
 
 import os
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any, AsyncGenerator
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Dict, Optional, Any, AsyncGenerator, Tuple
+import httpx
 import openai
 from dotenv import load_dotenv
 import time
@@ -18,31 +22,127 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Token-accurate truncation when tiktoken is installed; otherwise fall
+# back to character slicing at ~4 chars per token
+try:
+    import tiktoken
+    _ENCODER = tiktoken.encoding_for_model("gpt-3.5-turbo")
+except Exception:  # pragma: no cover - tiktoken is optional
+    _ENCODER = None
+
+
+def _truncate_to_budget(text: str, max_chars: int) -> str:
+    """Truncate text to a character budget, cutting on token boundaries
+    when an encoder is available so multi-byte text isn't over-trimmed"""
+    if _ENCODER is not None:
+        max_tokens = max(1, max_chars // 4)
+        tokens = _ENCODER.encode(text)
+        if len(tokens) > max_tokens:
+            return _ENCODER.decode(tokens[:max_tokens]) + "..."
+        return text
+    if len(text) > max_chars:
+        return text[:max_chars] + "..."
+    return text
+
+
+# One pooled HTTP client shared by every generator instance, so
+# concurrent requests reuse keepalive connections instead of paying TLS
+# setup per instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60.0,
+        )
+    return _http_client
+
+
+# Canned replies for trivial queries that need neither retrieval nor an
+# LLM call; keyed by the exact normalized query so ordinary questions
+# containing these words are never short-circuited
+_DIRECT_RESPONSES = {
+    "hello": "Hello! Ask me anything about the documents in your knowledge base.",
+    "hi": "Hello! Ask me anything about the documents in your knowledge base.",
+    "hey": "Hello! Ask me anything about the documents in your knowledge base.",
+    "thanks": "You're welcome! Let me know if you have more questions.",
+    "thank you": "You're welcome! Let me know if you have more questions.",
+    "bye": "Goodbye! Come back anytime you have questions about your documents.",
+    "goodbye": "Goodbye! Come back anytime you have questions about your documents.",
+}
+
+# Response cache bounds: entries expire after the TTL and the oldest is
+# evicted past the size cap
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+_RESPONSE_CACHE_TTL_SECONDS = 600.0
+
+# Chunk size used when replaying a cached response through the
+# streaming interface
+_CACHED_STREAM_CHUNK = 64
+
+# Static system prompt, hoisted so every request sends byte-identical
+# prefix tokens and provider-side prompt caching can apply
+_SYSTEM_PROMPT = """You are a helpful AI assistant with access to a knowledge base.
+Your task is to answer questions based on the provided context from the knowledge base.
+
+Guidelines:
+1. Answer questions based ONLY on the provided context
+2. If the context doesn't contain enough information, say so clearly
+3. Always cite your sources when possible
+4. Be concise but comprehensive
+5. If the question is about code, provide code examples when available
+6. If you're unsure about something, acknowledge the uncertainty
+
+Format your response clearly and provide source citations when possible."""
+
 
 class RAGResponseGenerator:
     """RAG response generator for contextual answer generation"""
     
     def __init__(self, model_name: str = "openai"):
-        """Initialize RAG response generator"""
+        """Initialize RAG response generator
+
+        The retriever and OpenAI client are created lazily on first use,
+        so instantiating the generator for its pure helpers costs nothing.
+        """
         self.model_name = model_name
-        self.retriever = RAGRetriever(model_name)
-        
-        # Initialize OpenAI client
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY must be set in environment variables")
-        
-        self.openai_client = openai.OpenAI(api_key=api_key)
-        
+
         # LLM model configuration
         self.llm_model = "gpt-3.5-turbo"
-        
+
         # Response generation configuration
         self.max_context_length = 4000  # Maximum context length for LLM
         self.max_response_length = 1000  # Maximum response length
+
+        # (normalized query, docsets) -> (timestamp, cached value);
+        # repeated queries skip retrieval and generation entirely
+        self._response_cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+        # Static message prefix built once; _prepare_messages extends a
+        # copy instead of re-allocating the system message per call
+        self._static_prefix: List[Dict] = [{"role": "system", "content": _SYSTEM_PROMPT}]
         
         logger.info(f"✅ RAG response generator initialized with model: {self.llm_model}")
-    
+
+    @cached_property
+    def retriever(self) -> RAGRetriever:
+        """Retriever, constructed on first use"""
+        return RAGRetriever(self.model_name)
+
+    @cached_property
+    def openai_client(self) -> openai.AsyncOpenAI:
+        """Async OpenAI client, constructed on first use"""
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY must be set in environment variables")
+
+        # Async client: token reads await the socket instead of blocking
+        # the event loop for the duration of the stream
+        return openai.AsyncOpenAI(api_key=api_key, http_client=_shared_http_client())
+
     async def generate_response(self, query: str, docsets: Optional[List[str]] = None,
                               conversation_history: Optional[List[Dict]] = None,
                               stream: bool = True) -> AsyncGenerator[str, None]:
@@ -59,33 +159,86 @@ class RAGResponseGenerator:
             Response chunks as they are generated
         """
         try:
+            # Trivial queries (greetings, thanks) get a canned reply with
+            # zero retrieval and zero LLM cost
+            direct = self._direct_response(query)
+            if direct is not None:
+                yield direct
+                return
+
+            # Serve repeated queries from the cache without touching
+            # retrieval or the LLM; history-dependent calls bypass it
+            cache_key = None
+            if not conversation_history:
+                cache_key = ("response", query.strip().lower(),
+                             tuple(docsets) if docsets else None)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    # Replay through the streaming contract
+                    for i in range(0, len(cached), _CACHED_STREAM_CHUNK):
+                        yield cached[i:i + _CACHED_STREAM_CHUNK]
+                        await asyncio.sleep(0)
+                    return
+
             # Retrieve relevant chunks
             retrieval_result = await self.retriever.hybrid_retrieve(query, docsets)
-            
+
             if retrieval_result["status"] != "success":
                 yield f"❌ Error retrieving context: {retrieval_result.get('error', 'Unknown error')}"
                 return
-            
+
             chunks = retrieval_result["chunks"]
-            
+
             if not chunks:
                 yield "❌ No relevant information found in the knowledge base. Please try rephrasing your question or add more documents to the knowledge base."
                 return
-            
+
             # Assemble context from chunks with source information
             context = self._assemble_context_with_sources(chunks)
-            
+
             # Generate response
             if stream:
+                parts = []
                 async for chunk in self._generate_streaming_response(query, context, conversation_history):
+                    parts.append(chunk)
                     yield chunk
+                response = "".join(parts)
             else:
                 response = await self._generate_complete_response(query, context, conversation_history)
                 yield response
-                
+
+            # Cache only complete, non-empty successes; a mid-stream
+            # failure raises out of the loop above, so partial output
+            # never reaches here
+            if cache_key is not None and response and not response.startswith("❌"):
+                self._cache_put(cache_key, response)
+
         except Exception as e:
             logger.error(f"❌ Error generating response: {e}")
             yield f"❌ Error generating response: {str(e)}"
+
+    def _direct_response(self, query: str) -> Optional[str]:
+        """Return a canned reply if the query is a recognized trivial one"""
+        return _DIRECT_RESPONSES.get(query.strip().lower().rstrip("!.?"))
+
+    def _cache_get(self, key: Tuple) -> Optional[Any]:
+        """Look up a cached value, dropping it if expired"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, value = entry
+        if time.time() - cached_at > _RESPONSE_CACHE_TTL_SECONDS:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, key: Tuple, value: Any) -> None:
+        """Store a value, evicting the oldest entry past the size cap"""
+        self._response_cache[key] = (time.time(), value)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
     
     def _assemble_context_with_sources(self, chunks: List[Dict]) -> str:
         """
@@ -98,27 +251,26 @@ class RAGResponseGenerator:
             Assembled context string with source attribution
         """
         context_parts = []
-        
+        remaining = self.max_context_length
+
         for i, chunk in enumerate(chunks):
             # Generate source URL
             source_url = self._generate_source_url(chunk)
             source_info = f"Source {i+1}: {chunk.get('document_name', 'Unknown')} ({source_url})"
-            
-            content = chunk.get('content', '')
-            
-            # Truncate content if too long
-            if len(content) > 800:
-                content = content[:800] + "..."
-            
-            context_parts.append(f"{source_info}\n{content}\n")
-        
-        context = "\n".join(context_parts)
-        
-        # Limit context length
-        if len(context) > self.max_context_length:
-            context = context[:self.max_context_length] + "..."
-        
-        return context
+
+            # Spend the remaining budget as we go instead of building the
+            # full string and slicing it afterwards
+            allowed = min(800, remaining - len(source_info) - 2)
+            if allowed <= 0:
+                break
+
+            content = _truncate_to_budget(chunk.get('content', ''), allowed)
+
+            part = f"{source_info}\n{content}\n"
+            context_parts.append(part)
+            remaining -= len(part) + 1  # +1 for the join separator
+
+        return "\n".join(context_parts)
     
     def _generate_source_url(self, chunk: Dict) -> str:
         """
@@ -184,49 +336,69 @@ class RAGResponseGenerator:
             Assembled context string
         """
         context_parts = []
-        
+        remaining = self.max_context_length
+
         for i, chunk in enumerate(chunks):
             source_info = f"Source {i+1}: {chunk.get('document_name', 'Unknown')}"
-            content = chunk.get('content', '')
-            
-            # Truncate content if too long
-            if len(content) > 800:
-                content = content[:800] + "..."
-            
-            context_parts.append(f"{source_info}\n{content}\n")
-        
-        context = "\n".join(context_parts)
-        
-        # Limit context length
-        if len(context) > self.max_context_length:
-            context = context[:self.max_context_length] + "..."
-        
-        return context
+
+            allowed = min(800, remaining - len(source_info) - 2)
+            if allowed <= 0:
+                break
+
+            content = _truncate_to_budget(chunk.get('content', ''), allowed)
+
+            part = f"{source_info}\n{content}\n"
+            context_parts.append(part)
+            remaining -= len(part) + 1  # +1 for the join separator
+
+        return "\n".join(context_parts)
     
     async def _generate_streaming_response(self, query: str, context: str,
                                          conversation_history: Optional[List[Dict]] = None) -> AsyncGenerator[str, None]:
-        """Generate streaming response"""
+        """Generate streaming response
+
+        The OpenAI stream is drained by a producer task into a bounded
+        queue, so a slow downstream consumer (UI backpressure) doesn't
+        stall the HTTP read, and network reads overlap with yielding.
+
+        Producer failures are re-raised here rather than yielded as
+        error text, so callers can tell a dropped stream apart from
+        response content (and never cache the partial output).
+        """
+        # Prepare messages
+        messages = self._prepare_messages(query, context, conversation_history)
+
+        queue: "asyncio.Queue[Optional[Any]]" = asyncio.Queue(maxsize=32)
+
+        async def producer():
+            try:
+                response = await self.openai_client.chat.completions.create(
+                    model=self.llm_model,
+                    messages=messages,
+                    stream=True,
+                    temperature=0.7,
+                    max_tokens=self.max_response_length
+                )
+                async for chunk in response:
+                    if chunk.choices[0].delta.content:
+                        await queue.put(chunk.choices[0].delta.content)
+            except Exception as e:
+                await queue.put(e)
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(producer())
         try:
-            # Prepare messages
-            messages = self._prepare_messages(query, context, conversation_history)
-            
-            # Generate streaming response
-            response = self.openai_client.chat.completions.create(
-                model=self.llm_model,
-                messages=messages,
-                stream=True,
-                temperature=0.7,
-                max_tokens=self.max_response_length
-            )
-            
-            # Stream response chunks
-            for chunk in response:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-                    
-        except Exception as e:
-            logger.error(f"❌ Error in streaming response generation: {e}")
-            yield f"❌ Error generating response: {str(e)}"
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"❌ Error in streaming response generation: {item}")
+                    raise item
+                yield item
+        finally:
+            task.cancel()
     
     async def _generate_complete_response(self, query: str, context: str,
                                         conversation_history: Optional[List[Dict]] = None) -> str:
@@ -236,13 +408,13 @@ class RAGResponseGenerator:
             messages = self._prepare_messages(query, context, conversation_history)
             
             # Generate response
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model=self.llm_model,
                 messages=messages,
                 temperature=0.7,
                 max_tokens=self.max_response_length
             )
-            
+
             return response.choices[0].message.content
             
         except Exception as e:
@@ -251,38 +423,36 @@ class RAGResponseGenerator:
     
     def _prepare_messages(self, query: str, context: str,
                          conversation_history: Optional[List[Dict]] = None) -> List[Dict]:
-        """Prepare messages for LLM"""
-        system_prompt = """You are a helpful AI assistant with access to a knowledge base. 
-Your task is to answer questions based on the provided context from the knowledge base.
+        """Prepare messages for LLM
 
-Guidelines:
-1. Answer questions based ONLY on the provided context
-2. If the context doesn't contain enough information, say so clearly
-3. Always cite your sources when possible
-4. Be concise but comprehensive
-5. If the question is about code, provide code examples when available
-6. If you're unsure about something, acknowledge the uncertainty
+        Messages go static-first, dynamic-last — system prompt, then
+        history, then the per-request context and query as separate turns —
+        so the stable prefix stays byte-identical across calls and
+        provider prompt caching can kick in.
+        """
+        # Trim long histories to a front-anchored window: the earliest
+        # turns stay in place so the prompt prefix remains byte-stable as
+        # the conversation grows (a plain tail slice shifts every message
+        # and defeats provider prompt caching), while the sliding tail
+        # keeps recent turns
+        if conversation_history and len(conversation_history) > 10:
+            conversation_history = conversation_history[:2] + conversation_history[-8:]
 
-Format your response clearly and provide source citations when possible."""
+        # One C-level list concat; the prefix dict itself is shared
+        messages = self._static_prefix + (conversation_history or [])
 
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history if provided
-        if conversation_history:
-            # Limit history to last 10 messages to avoid token limits
-            recent_history = conversation_history[-10:]
-            messages.extend(recent_history)
-        
-        # Add current query with context
-        user_message = f"""Context from knowledge base:
-{context}
+        # Per-request context as its own turn, kept out of the query string
+        messages.append({
+            "role": "user",
+            "content": f"Context from knowledge base:\n{context}"
+        })
 
-Question: {query}
+        # Current query last
+        messages.append({
+            "role": "user",
+            "content": f"Question: {query}\n\nPlease provide a comprehensive answer based on the context above."
+        })
 
-Please provide a comprehensive answer based on the context above."""
-        
-        messages.append({"role": "user", "content": user_message})
-        
         return messages
     
     async def generate_response_with_metadata(self, query: str, docsets: Optional[List[str]] = None,
@@ -300,7 +470,17 @@ Please provide a comprehensive answer based on the context above."""
         """
         try:
             start_time = time.time()
-            
+
+            # Serve repeated queries from the cache; history-dependent
+            # calls bypass it
+            cache_key = None
+            if not conversation_history:
+                cache_key = ("metadata", query.strip().lower(),
+                             tuple(docsets) if docsets else None)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
             # Retrieve chunks
             retrieval_result = await self.retriever.hybrid_retrieve(query, docsets)
             
@@ -331,19 +511,20 @@ Please provide a comprehensive answer based on the context above."""
             
             # Assemble context with source information
             context = self._assemble_context_with_sources(chunks)
-            
+
+            # Sources depend only on the chunks, so build them before the
+            # slow LLM await rather than after it
+            sources = self._prepare_sources_with_urls(chunks)
+
             # Generate response
             generation_start = time.time()
             response = await self._generate_complete_response(query, context, conversation_history)
             generation_time = time.time() - generation_start
-            
-            # Prepare sources with enhanced information
-            sources = self._prepare_sources_with_urls(chunks)
-            
+
             # Calculate total time
             total_time = time.time() - start_time
-            
-            return {
+
+            result = {
                 "status": "success",
                 "query": query,
                 "response": response,
@@ -357,6 +538,11 @@ Please provide a comprehensive answer based on the context above."""
                     "response_length": len(response)
                 }
             }
+
+            if cache_key is not None and response and not response.startswith("❌"):
+                self._cache_put(cache_key, result)
+
+            return result
             
         except Exception as e:
             logger.error(f"❌ Error in response generation with metadata: {e}")
@@ -369,17 +555,100 @@ Please provide a comprehensive answer based on the context above."""
                 "metadata": {}
             }
     
+    async def generate_response_with_metadata_stream(self, query: str, docsets: Optional[List[str]] = None,
+                                                     conversation_history: Optional[List[Dict]] = None) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Generate response with metadata, streaming chunks as they arrive
+
+        Yields {"type": "chunk", "delta": ...} events while the LLM
+        streams, then a final {"type": "done", ...} event carrying the full
+        response, sources and timing metadata. Time-to-first-token stays at
+        prefill latency instead of full generation time.
+
+        Args:
+            query: User query
+            docsets: Optional list of docset names
+            conversation_history: Optional conversation history
+
+        Yields:
+            Event dictionaries as described above
+        """
+        try:
+            start_time = time.time()
+
+            # Retrieve chunks
+            retrieval_result = await self.retriever.hybrid_retrieve(query, docsets)
+
+            if retrieval_result["status"] != "success":
+                yield {
+                    "type": "error",
+                    "query": query,
+                    "error": retrieval_result.get("error", "Unknown error")
+                }
+                return
+
+            chunks = retrieval_result["chunks"]
+
+            if not chunks:
+                yield {
+                    "type": "done",
+                    "query": query,
+                    "response": "No relevant information found in the knowledge base.",
+                    "sources": [],
+                    "metadata": {
+                        "chunks_retrieved": 0,
+                        "retrieval_time": retrieval_result.get("retrieval_time", 0),
+                        "generation_time": 0
+                    }
+                }
+                return
+
+            # Assemble context with source information
+            context = self._assemble_context_with_sources(chunks)
+
+            # Stream the response, accumulating for the final event
+            generation_start = time.time()
+            response_parts: List[str] = []
+            async for delta in self._generate_streaming_response(query, context, conversation_history):
+                response_parts.append(delta)
+                yield {"type": "chunk", "delta": delta}
+            generation_time = time.time() - generation_start
+
+            response = "".join(response_parts)
+            sources = self._prepare_sources_with_urls(chunks)
+            total_time = time.time() - start_time
+
+            yield {
+                "type": "done",
+                "query": query,
+                "response": response,
+                "sources": sources,
+                "metadata": {
+                    "chunks_retrieved": len(chunks),
+                    "retrieval_time": retrieval_result.get("retrieval_time", 0),
+                    "generation_time": generation_time,
+                    "total_time": total_time,
+                    "context_length": len(context),
+                    "response_length": len(response)
+                }
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Error in streaming response generation with metadata: {e}")
+            yield {"type": "error", "query": query, "error": str(e)}
+
     def _prepare_sources_with_urls(self, chunks: List[Dict]) -> List[Dict]:
         """Prepare source information with URLs for response"""
         sources = []
         
         for chunk in chunks:
             source_url = self._generate_source_url(chunk)
+            content = chunk.get("content", "")
             source = {
                 "document_name": chunk.get("document_name", "Unknown"),
                 "docset_name": chunk.get("docset_name", "Unknown"),
                 "source_url": source_url,
-                "content_preview": chunk.get("content", "")[:200] + "..." if len(chunk.get("content", "")) > 200 else chunk.get("content", ""),
+                "content_preview": content[:200] + "..." if len(content) > 200 else content,
                 "chunk_index": chunk.get("chunk_index", 0),
                 "metadata": chunk.get("metadata", {})
             }
@@ -392,10 +661,11 @@ Please provide a comprehensive answer based on the context above."""
         sources = []
         
         for chunk in chunks:
+            content = chunk.get("content", "")
             source = {
                 "document_name": chunk.get("document_name", "Unknown"),
                 "docset_name": chunk.get("docset_name", "Unknown"),
-                "content_preview": chunk.get("content", "")[:200] + "..." if len(chunk.get("content", "")) > 200 else chunk.get("content", ""),
+                "content_preview": content[:200] + "..." if len(content) > 200 else content,
                 "chunk_index": chunk.get("chunk_index", 0)
             }
             sources.append(source)
@@ -87,19 +87,77 @@ class RAGRetriever:
         except Exception as e:
             logger.error(f"❌ Error retrieving chunks for query '{query}': {e}")
             return []
-    
+
+    async def retrieve_chunks_batch(self, queries: List[str], docsets: Optional[List[str]] = None,
+                                  top_k: int = None, use_rerank: bool = True) -> List[List[Dict]]:
+        """
+        Retrieve relevant chunks for multiple queries at once
+
+        Embeddings for all queries are generated in a single API call, and
+        the per-query searches run concurrently.
+
+        Args:
+            queries: Search queries
+            docsets: Optional list of docset names to search in
+            top_k: Number of results to return per query
+            use_rerank: Whether to use GPT reranking
+
+        Returns:
+            List of chunk lists, one per query, in the input order
+        """
+        if not queries:
+            return []
+
+        try:
+            top_k = top_k or self.default_top_k
+
+            # One embeddings call covers every query in the batch
+            query_embeddings = await self._generate_query_embeddings(queries)
+        except Exception as e:
+            logger.error(f"❌ Error embedding query batch: {e}")
+            return [[] for _ in queries]
+
+        async def retrieve_one(query: str, query_embedding: List[float]) -> List[Dict]:
+            try:
+                candidates = await self._vector_search(query_embedding, docsets, top_k * 2)
+
+                if not candidates:
+                    logger.warning(f"No chunks found for query: {query}")
+                    return []
+
+                if use_rerank and len(candidates) > 1:
+                    return await self._gpt_rerank(query, candidates, top_k)
+                return candidates[:top_k]
+
+            except Exception as e:
+                logger.error(f"❌ Error retrieving chunks for query '{query}': {e}")
+                return []
+
+        results = await asyncio.gather(*(
+            retrieve_one(query, embedding)
+            for query, embedding in zip(queries, query_embeddings)
+        ))
+
+        logger.info(f"✅ Batch retrieval completed for {len(queries)} queries")
+        return list(results)
+
     async def _generate_query_embedding(self, query: str) -> List[float]:
         """Generate embedding for query"""
+        embeddings = await self._generate_query_embeddings([query])
+        return embeddings[0]
+
+    async def _generate_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Generate embeddings for multiple queries in one API call"""
         try:
             response = self.openai_client.embeddings.create(
                 model=self.embedding_model,
-                input=[query]
+                input=queries
             )
-            
-            return response.data[0].embedding
-            
+
+            return [item.embedding for item in response.data]
+
         except Exception as e:
-            logger.error(f"❌ Error generating query embedding: {e}")
+            logger.error(f"❌ Error generating query embeddings: {e}")
             raise
     
     async def _vector_search(self, query_embedding: List[float], 
@@ -335,7 +393,58 @@ class RAGRetriever:
                 "error": str(e),
                 "chunks": []
             }
-    
+
+    async def hybrid_retrieve_batch(self, queries: List[str], docsets: Optional[List[str]] = None,
+                                  top_k: int = None, use_rerank: bool = True) -> List[Dict[str, Any]]:
+        """
+        Hybrid retrieval for multiple queries sharing one embedding call
+
+        Args:
+            queries: Search queries
+            docsets: Optional list of docset names
+            top_k: Number of results to return per query
+            use_rerank: Whether to use GPT reranking
+
+        Returns:
+            List of hybrid retrieval results, one per query, in the input order
+        """
+        try:
+            start_time = time.time()
+
+            # Retrieve all queries concurrently off a single embedding batch
+            chunk_lists = await self.retrieve_chunks_batch(queries, docsets, top_k, use_rerank)
+
+            # Calculate retrieval time (shared across the batch)
+            retrieval_time = time.time() - start_time
+
+            # Get statistics once; every query in the batch shares the same docsets
+            stats = self.get_retrieval_stats(docsets[0] if docsets and len(docsets) == 1 else None)
+
+            return [
+                {
+                    "status": "success",
+                    "query": query,
+                    "chunks": chunks,
+                    "retrieval_time": retrieval_time,
+                    "chunks_count": len(chunks),
+                    "use_rerank": use_rerank,
+                    "stats": stats
+                }
+                for query, chunks in zip(queries, chunk_lists)
+            ]
+
+        except Exception as e:
+            logger.error(f"❌ Error in batch hybrid retrieval: {e}")
+            return [
+                {
+                    "status": "error",
+                    "query": query,
+                    "error": str(e),
+                    "chunks": []
+                }
+                for query in queries
+            ]
+
     def search_similar_chunks(self, chunk_id: str, top_k: int = 5) -> List[Dict]:
         """
         Find similar chunks to a given chunk
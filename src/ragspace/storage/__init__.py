@@ -1,71 +1,92 @@
 """
 Storage interface for RAGSpace
+
+Manager implementations are imported lazily (PEP 562) so that importing
+this package does not pull in the Supabase client until a manager is
+actually requested.
 """
 
+import importlib
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Dict, Optional
 
 class StorageInterface(ABC):
     """Abstract storage interface for RAGSpace"""
-    
+
     @abstractmethod
     def create_docset(self, name: str, description: str = "") -> str:
         """Create a new docset"""
         pass
-    
+
     @abstractmethod
     def get_docset_by_name(self, name: str) -> Optional[Dict]:
         """Get a docset by name"""
         pass
-    
+
     @abstractmethod
     def list_docsets(self) -> str:
         """List all docsets"""
         pass
-    
+
     @abstractmethod
-    def add_document_to_docset(self, docset_name: str, title: str, content: str, 
+    def add_document_to_docset(self, docset_name: str, title: str, content: str,
                               doc_type: str = "file", metadata: Optional[Dict] = None) -> str:
         """Add a document to a specific docset"""
         pass
-    
+
     @abstractmethod
     def list_documents_in_docset(self, docset_name: str) -> str:
         """List all documents in a specific docset"""
         pass
-    
+
     @abstractmethod
     def query_knowledge_base(self, query: str, docset_name: Optional[str] = None) -> str:
         """Query the knowledge base"""
         pass
-    
+
     @abstractmethod
     def get_docsets_dict(self) -> Dict[str, Dict]:
         """Get all docsets as a dictionary (for UI compatibility)"""
         pass
 
-# Import implementations
-from .manager import MockDocsetManager
-from .supabase_manager import SupabaseDocsetManager
+# Maps manager classes to the submodule that defines them
+_LAZY_IMPORTS = {
+    "MockDocsetManager": ".manager",
+    "SupabaseDocsetManager": ".supabase_manager",
+}
 
-# Default to Mock for now, will be switched to Supabase when needed
-docset_manager: StorageInterface = MockDocsetManager()
+def __getattr__(name):
+    """Resolve manager classes and the default manager on first access"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name == "docset_manager":
+        # Default to Mock for now, will be switched to Supabase when needed
+        from .manager import MockDocsetManager
+        manager: StorageInterface = MockDocsetManager()
+        globals()["docset_manager"] = manager
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def use_supabase():
     """Switch to Supabase storage (for production)"""
     global docset_manager
+    from .supabase_manager import SupabaseDocsetManager
     docset_manager = SupabaseDocsetManager()
 
 def use_mock():
     """Switch to Mock storage (for testing)"""
     global docset_manager
+    from .manager import MockDocsetManager
     docset_manager = MockDocsetManager()
 
 __all__ = [
     "StorageInterface",
-    "MockDocsetManager", 
+    "MockDocsetManager",
     "SupabaseDocsetManager",
     "docset_manager",
     "use_supabase",
     "use_mock"
-] 
\ No newline at end of file
+]
@@ -12,16 +12,23 @@ class MockDocsetManager(StorageInterface):
     
     def __init__(self):
         self.docsets: Dict[str, DocSet] = {}
-    
+        # Bumped on every mutation so callers can cache derived views
+        self._version = 0
+        # Hot (name, description) column for listings, maintained alongside
+        # self.docsets so list views don't have to touch full DocSet objects
+        self._name_desc_index: List[tuple] = []
+
     def create_docset(self, name: str, description: str = "") -> str:
         """Create a new docset"""
         if not name.strip():
             return f"DocSet name cannot be empty."
-        
+
         if name in self.docsets:
             return f"DocSet '{name}' already exists."
-        
+
         self.docsets[name] = DocSet(name, description)
+        self._name_desc_index.append((name, description))
+        self._version += 1
         return f"✅ DocSet '{name}' created successfully."
     
     def get_docset_by_name(self, name: str) -> Optional[Dict]:
@@ -41,15 +48,18 @@ class MockDocsetManager(StorageInterface):
         if not self.docsets:
             return "No docsets available."
         
-        result = "📚 Available DocSets:\n\n"
+        # Collect lines and join once instead of quadratic str concatenation
+        lines = ["📚 Available DocSets:", ""]
         for name, docset in self.docsets.items():
-            result += f"📁 {name}\n"
-            result += f"   Description: {docset.description}\n"
-            result += f"   Documents: {len(docset.documents)}\n"
-            result += f"   Created: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(docset.metadata['created_at']))}\n"
-            result += f"   Updated: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(docset.metadata['updated_at']))}\n\n"
-        
-        return result
+            metadata = docset.metadata
+            lines.append(f"📁 {name}")
+            lines.append(f"   Description: {docset.description}")
+            lines.append(f"   Documents: {len(docset.documents)}")
+            lines.append(f"   Created: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(metadata['created_at']))}")
+            lines.append(f"   Updated: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(metadata['updated_at']))}")
+            lines.append("")
+
+        return "\n".join(lines) + "\n"
     
 
     
@@ -93,12 +103,11 @@ class MockDocsetManager(StorageInterface):
             # Search in all docsets
             search_docsets = self.docsets
         
-        # Search for relevant documents
+        # Search for relevant documents via each docset's token index
         results = []
         for docset_name, docset in search_docsets.items():
-            for doc in docset.documents:
-                if query.lower() in doc.content.lower() or query.lower() in doc.title.lower():
-                    results.append((docset_name, doc))
+            for doc in docset.search_documents(query):
+                results.append((docset_name, doc))
         
         if results:
             response = f"Found {len(results)} relevant documents:\n\n"
@@ -135,7 +144,8 @@ class MockDocsetManager(StorageInterface):
         
         doc = Document(title, content, doc_type, metadata)
         self.docsets[docset_name].add_document(doc)
-        
+        self._version += 1
+
         return f"✅ Document '{title}' added to docset '{docset_name}'."
     
     def add_url_to_docset(self, url: str, docset_name: str, **kwargs) -> str:
@@ -3,7 +3,6 @@ Supabase DocSet Manager for RAGSpace (Production)
 """
 
 import os
-import time
 from typing import Dict, Optional, List
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -1,13 +1,30 @@
 """
 UI Components for RAGSpace
+
+Submodules are imported lazily (PEP 562) so that importing the package
+does not pull in gradio until a component factory is actually used.
 """
 
-from .knowledge_management import create_knowledge_management_tab
-from .chat_interface import create_chat_interface_tab
-from .mcp_tools import create_mcp_tools_tab
+import importlib
+
+# Maps public names to the submodule that defines them
+_LAZY_IMPORTS = {
+    "create_knowledge_management_tab": ".knowledge_management",
+    "create_chat_interface_tab": ".chat_interface",
+    "create_mcp_tools_tab": ".mcp_tools",
+}
 
 __all__ = [
     "create_knowledge_management_tab",
-    "create_chat_interface_tab", 
+    "create_chat_interface_tab",
     "create_mcp_tools_tab"
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Resolve public names on first access by importing their submodule"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
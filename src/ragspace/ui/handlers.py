@@ -3,9 +3,8 @@ UI Event Handlers for RAGSpace
 """
 
 import asyncio
-import logging
 import gradio as gr
-from typing import List, Dict, Optional, Any, AsyncGenerator
+from typing import List, Dict, Any
 
 def get_docset_manager():
     """Get the current docset manager"""
@@ -22,59 +21,58 @@ def create_docset_ui(name: str, description: str) -> str:
     docset_manager = get_docset_manager()
     return docset_manager.create_docset(name, description)
 
+def _process_uploaded_file(file, docset_name: str) -> str:
+    """Build a document from one uploaded file, add it, return a status line"""
+    import os
+    # Extract original filename from the full path
+    if hasattr(file, 'name'):
+        # Handle both string and Mock objects
+        if isinstance(file.name, str):
+            original_filename = os.path.basename(file.name)
+        else:
+            # For Mock objects, try to get the name from the mock
+            original_filename = str(file.name) if hasattr(file.name, '__str__') else "Unknown file"
+    else:
+        original_filename = "Unknown file"
+
+    # For demo purposes, create a simple document from file name
+    title = f"Uploaded: {original_filename}"
+
+    # Handle different file object types
+    try:
+        if hasattr(file, 'size'):
+            file_size = f"{file.size} bytes"
+        elif hasattr(file, 'name'):
+            file_size = "Unknown size"
+        else:
+            file_size = "Unknown size"
+
+        if hasattr(file, 'type'):
+            file_type = file.type
+        else:
+            file_type = "Unknown"
+
+        content = f"File: {original_filename}\nSize: {file_size}\nType: {file_type}"
+    except Exception as e:
+        content = f"File: {original_filename}\nError reading file info: {str(e)}"
+
+    docset_manager = get_docset_manager()
+    result = docset_manager.add_document_to_docset(docset_name, title, content, "file")
+
+    # Check if the operation was successful
+    if "✅" in result:
+        return f"✅ Added: {original_filename}"
+    return f"❌ Failed: {original_filename} - {result}"
+
 def upload_file_to_docset(files, docset_name: str) -> str:
     """Handle file uploads to specific docset - UI handler"""
     if files is None:
         return "No files uploaded"
-    
+
     if not docset_name.strip():
         return "Please specify a docset name"
-    
-    file_info = []
-    for file in files:
-        # Extract original filename from the full path
-        import os
-        if hasattr(file, 'name'):
-            # Handle both string and Mock objects
-            if isinstance(file.name, str):
-                original_filename = os.path.basename(file.name)
-            else:
-                # For Mock objects, try to get the name from the mock
-                original_filename = str(file.name) if hasattr(file.name, '__str__') else "Unknown file"
-        else:
-            original_filename = "Unknown file"
-        
-        # For demo purposes, create a simple document from file name
-        title = f"Uploaded: {original_filename}"
-        
-        # Handle different file object types
-        try:
-            if hasattr(file, 'size'):
-                file_size = f"{file.size} bytes"
-            elif hasattr(file, 'name'):
-                file_size = "Unknown size"
-            else:
-                file_size = "Unknown size"
-            
-            if hasattr(file, 'type'):
-                file_type = file.type
-            else:
-                file_type = "Unknown"
-            
-            content = f"File: {original_filename}\nSize: {file_size}\nType: {file_type}"
-        except Exception as e:
-            content = f"File: {original_filename}\nError reading file info: {str(e)}"
-        
-        docset_manager = get_docset_manager()
-        result = docset_manager.add_document_to_docset(docset_name, title, content, "file")
-        
-        # Check if the operation was successful
-        if "✅" in result:
-            file_info.append(f"✅ Added: {original_filename}")
-        else:
-            file_info.append(f"❌ Failed: {original_filename} - {result}")
-    
-    return "\n".join(file_info)
+
+    return "\n".join(_process_uploaded_file(file, docset_name) for file in files)
 
 def add_url_to_docset(url: str, docset_name: str, website_type: str = "website") -> str:
     """Handle URL input for web scraping to specific docset - UI handler"""
@@ -416,53 +414,20 @@ def trigger_embedding_for_docset(docset_name: str) -> str:
     except Exception as e:
         return f"❌ Error triggering embedding: {str(e)}"
 
-def upload_files(files, docset_name: str) -> tuple:
-    """Handle file uploads to specific docset - UI handler"""
+async def upload_files(files, docset_name: str) -> tuple:
+    """Handle file uploads to specific docset - UI handler
+
+    Each file is independent, so the batch is processed concurrently in
+    worker threads while the Gradio event loop keeps serving requests.
+    """
     if files is None:
         return "No files uploaded", None
-    
+
     if not docset_name.strip():
         return "Please specify a docset name", None
-    
-    file_info = []
-    for file in files:
-        # Extract original filename from the full path
-        import os
-        if hasattr(file, 'name'):
-            if isinstance(file.name, str):
-                original_filename = os.path.basename(file.name)
-            else:
-                original_filename = str(file.name) if hasattr(file.name, '__str__') else "Unknown file"
-        else:
-            original_filename = "Unknown file"
-        
-        title = f"Uploaded: {original_filename}"
-        
-        try:
-            if hasattr(file, 'size'):
-                file_size = f"{file.size} bytes"
-            elif hasattr(file, 'name'):
-                file_size = "Unknown size"
-            else:
-                file_size = "Unknown size"
-            
-            if hasattr(file, 'type'):
-                file_type = file.type
-            else:
-                file_type = "Unknown"
-            
-            content = f"File: {original_filename}\nSize: {file_size}\nType: {file_type}"
-        except Exception as e:
-            content = f"File: {original_filename}\nError reading file info: {str(e)}"
-        
-        docset_manager = get_docset_manager()
-        result = docset_manager.add_document_to_docset(docset_name, title, content, "file")
-        
-        if "✅" in result:
-            file_info.append(f"✅ Added: {original_filename}")
-        else:
-            file_info.append(f"❌ Failed: {original_filename} - {result}")
-    
+
+    tasks = [asyncio.to_thread(_process_uploaded_file, file, docset_name) for file in files]
+    file_info = await asyncio.gather(*tasks)
     return "\n".join(file_info), gr.Textbox(value=docset_name)
 
 def update_target_docsets(docset_name: str) -> gr.Textbox:
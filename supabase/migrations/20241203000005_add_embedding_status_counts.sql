@@ -0,0 +1,26 @@
+-- Migration: Add server-side embedding status aggregation
+-- Migration: 20241203000005_add_embedding_status_counts.sql
+
+-- Count documents per embedding status in the database instead of
+-- shipping every row to the client
+CREATE OR REPLACE FUNCTION embedding_status_counts(
+    filter_docset_id uuid DEFAULT NULL
+)
+RETURNS TABLE(
+    embedding_status text,
+    count bigint
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        d.embedding_status,
+        COUNT(*) AS count
+    FROM documents d
+    WHERE filter_docset_id IS NULL OR d.docset_id = filter_docset_id
+    GROUP BY d.embedding_status;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Grant execute permission
+GRANT EXECUTE ON FUNCTION embedding_status_counts(uuid) TO anon;
+GRANT EXECUTE ON FUNCTION embedding_status_counts(uuid) TO authenticated;
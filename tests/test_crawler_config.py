@@ -10,7 +10,14 @@ from src.ragspace.config import CrawlerConfig
 
 class TestCrawlerConfig:
     """Test crawler configuration functionality"""
-    
+
+    @pytest.fixture(autouse=True)
+    def reload_config(self):
+        """Clear cached configurations so each test sees its patched environment"""
+        CrawlerConfig.reload()
+        yield
+        CrawlerConfig.reload()
+
     def test_github_config_defaults(self):
         """Test GitHub configuration with default values"""
         with patch.dict(os.environ, {}, clear=True):
@@ -43,9 +50,9 @@ class TestCrawlerConfig:
             assert config["token"] == "test-token"
             assert config["base_url"] == "https://api.github.com/v3"
             assert config["user_agent"] == "TestAgent/1.0"
-            assert config["file_types"] == [".md", ".txt", ".py"]
+            assert config["file_types"] == (".md", ".txt", ".py")
             assert config["max_file_size"] == 100000
-            assert config["skip_patterns"] == ["test", "skip"]
+            assert config["skip_patterns"] == ("test", "skip")
             assert config["max_depth"] == 5
             assert config["rate_limit_warning"] is False
     
@@ -79,9 +86,9 @@ class TestCrawlerConfig:
             
             assert config["max_depth"] == 3
             assert config["max_pages"] == 20
-            assert config["skip_patterns"] == ["test", "skip"]
-            assert config["content_selectors"] == ["main", "article"]
-            assert config["title_selectors"] == ["h1", "title"]
+            assert config["skip_patterns"] == ("test", "skip")
+            assert config["content_selectors"] == ("main", "article")
+            assert config["title_selectors"] == ("h1", "title")
             assert config["user_agent"] == "TestAgent/1.0"
             assert config["timeout"] == 15
             assert config["max_content_size"] == 100000
@@ -170,14 +177,14 @@ class TestCrawlerConfig:
         }, clear=True):
             from src.ragspace.config.crawler_config import _parse_list_env
             result = _parse_list_env("TEST_LIST", ["default"])
-            assert result == ["item1", "item2", "item3"]
+            assert result == ("item1", "item2", "item3")
     
     def test_parse_list_env_empty(self):
         """Test parsing empty list environment variable"""
         with patch.dict(os.environ, {}, clear=True):
             from src.ragspace.config.crawler_config import _parse_list_env
             result = _parse_list_env("TEST_LIST", ["default"])
-            assert result == ["default"]
+            assert result == ("default",)
     
     def test_parse_int_env(self):
         """Test parsing integer environment variables"""
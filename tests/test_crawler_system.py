@@ -248,7 +248,7 @@ class TestGitHubCrawler:
         assert crawler.determine_content_type("image.png") == ContentType.IMAGE
         assert crawler.determine_content_type("unknown.xyz") == ContentType.UNKNOWN
     
-    @patch('src.ragspace.services.crawler.github_crawler.requests.get')
+    @patch('src.ragspace.services.crawler.github_crawler.requests.Session.get')
     def test_get_rate_limit_info(self, mock_get):
         """Test rate limit info retrieval"""
         crawler = GitHubCrawler()
@@ -275,7 +275,7 @@ class TestGitHubCrawler:
         assert result["limit"] == 5000
         assert result["remaining"] == 4999
     
-    @patch('src.ragspace.services.crawler.github_crawler.requests.get')
+    @patch('src.ragspace.services.crawler.github_crawler.requests.Session.get')
     def test_get_rate_limit_info_error(self, mock_get):
         """Test rate limit info error handling"""
         crawler = GitHubCrawler()
@@ -382,50 +382,52 @@ class TestGitHubCrawler:
             except Exception as e:
                 pytest.fail(f"Wildcard pattern '{pattern}' caused unexpected error: {e}")
     
-    @patch('src.ragspace.services.crawler.github_crawler.requests.get')
+    @patch('src.ragspace.services.crawler.github_crawler.requests.Session.get')
     def test_different_repos_same_filename_no_conflict(self, mock_get):
         """Test that documents from different repositories with same filename don't conflict"""
         crawler = GitHubCrawler()
         
         # Mock GitHub API responses for two different repositories
         mock_responses = [
-            # First repo: owner1/repo1
+            # First repo: owner1/repo1 (git tree)
             Mock(
                 status_code=200,
-                json=lambda: [
-                    {
-                        "name": "README.md",
-                        "path": "README.md",
-                        "type": "file",
-                        "download_url": "https://raw.githubusercontent.com/owner1/repo1/main/README.md",
-                        "url": "https://api.github.com/repos/owner1/repo1/contents/README.md",
-                        "size": 100
-                    }
-                ]
+                json=lambda: {
+                    "truncated": False,
+                    "tree": [
+                        {
+                            "path": "README.md",
+                            "type": "blob",
+                            "size": 100,
+                            "url": "https://api.github.com/repos/owner1/repo1/git/blobs/abc123"
+                        }
+                    ]
+                }
             ),
             # File content for first repo
             Mock(
                 status_code=200,
-                text="Content from owner1/repo1 README"
+                iter_content=lambda chunk_size: [b"Content from owner1/repo1 README"]
             ),
-            # Second repo: owner2/repo2  
+            # Second repo: owner2/repo2 (git tree)
             Mock(
                 status_code=200,
-                json=lambda: [
-                    {
-                        "name": "README.md",
-                        "path": "README.md",
-                        "type": "file",
-                        "download_url": "https://raw.githubusercontent.com/owner2/repo2/main/README.md",
-                        "url": "https://api.github.com/repos/owner2/repo2/contents/README.md",
-                        "size": 100
-                    }
-                ]
+                json=lambda: {
+                    "truncated": False,
+                    "tree": [
+                        {
+                            "path": "README.md",
+                            "type": "blob",
+                            "size": 100,
+                            "url": "https://api.github.com/repos/owner2/repo2/git/blobs/def456"
+                        }
+                    ]
+                }
             ),
             # File content for second repo
             Mock(
                 status_code=200,
-                text="Content from owner2/repo2 README"
+                iter_content=lambda chunk_size: [b"Content from owner2/repo2 README"]
             )
         ]
         
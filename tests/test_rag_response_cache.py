@@ -0,0 +1,120 @@
+"""
+Tests for RAG response caching and stream failure handling
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.ragspace.services.rag.rag_response_generator import RAGResponseGenerator
+
+
+def _stream_chunk(text):
+    """Build a minimal OpenAI streaming chunk"""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+class _FakeOpenAIClient:
+    """Fake AsyncOpenAI client that serves streams from a factory"""
+
+    def __init__(self, stream_factory):
+        self.create_calls = 0
+
+        async def create(**kwargs):
+            self.create_calls += 1
+            return stream_factory()
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+class _FakeRetriever:
+    """Fake retriever returning one chunk for every query"""
+
+    async def hybrid_retrieve(self, query, docsets=None):
+        return {
+            "status": "success",
+            "chunks": [{
+                "content": "chunk content",
+                "document_name": "Doc",
+                "docset_name": "test",
+                "metadata": {}
+            }],
+            "retrieval_time": 0.0
+        }
+
+
+async def _dying_stream():
+    """Stream that drops after the first token"""
+    yield _stream_chunk("partial answer ")
+    raise RuntimeError("stream dropped")
+
+
+async def _empty_stream():
+    """Stream that finishes without yielding any tokens"""
+    return
+    yield  # pragma: no cover
+
+
+async def _ok_stream():
+    yield _stream_chunk("final ")
+    yield _stream_chunk("answer")
+
+
+def _make_generator(stream_factory):
+    generator = RAGResponseGenerator()
+    generator.retriever = _FakeRetriever()
+    generator.openai_client = _FakeOpenAIClient(stream_factory)
+    return generator
+
+
+async def _collect(async_gen):
+    return [part async for part in async_gen]
+
+
+class TestResponseCache:
+    """Test response caching around streaming failures"""
+
+    def test_mid_stream_failure_not_cached(self):
+        """A stream that drops after N tokens must not poison the cache"""
+        generator = _make_generator(_dying_stream)
+
+        parts = asyncio.run(_collect(generator.generate_response("what is x")))
+
+        # The caller still sees the error, after the partial output
+        assert any(part.startswith("❌") for part in parts)
+
+        # The partial-plus-error text must not be cached
+        assert len(generator._response_cache) == 0
+
+        # An identical query goes back to the LLM instead of replaying
+        asyncio.run(_collect(generator.generate_response("what is x")))
+        assert generator.openai_client.create_calls == 2
+
+    def test_empty_stream_not_cached(self):
+        """A zero-chunk stream must not cache an empty response"""
+        generator = _make_generator(_empty_stream)
+
+        asyncio.run(_collect(generator.generate_response("what is x")))
+
+        assert len(generator._response_cache) == 0
+
+    def test_successful_response_cached(self):
+        """A complete stream is cached and replayed without the LLM"""
+        generator = _make_generator(_ok_stream)
+
+        first = asyncio.run(_collect(generator.generate_response("what is x")))
+        second = asyncio.run(_collect(generator.generate_response("what is x")))
+
+        assert "".join(first) == "final answer"
+        assert "".join(second) == "final answer"
+        assert generator.openai_client.create_calls == 1
+
+    def test_history_bypasses_cache(self):
+        """History-dependent calls never read or write the cache"""
+        generator = _make_generator(_ok_stream)
+        history = [{"role": "user", "content": "earlier question"}]
+
+        asyncio.run(_collect(generator.generate_response("what is x", conversation_history=history)))
+
+        assert len(generator._response_cache) == 0